@@ -1,6 +1,5 @@
 from base import InvariantCheck, InvariantChecker, InvariantResult
-from evoalign.provenance import sha256_canonical, sha256_data_file, verify_hash
-from file_utils import iter_data_files
+from evoalign.provenance import normalize_hash, verify_hash
 from provenance_utils import load_aars
 from secrecy_utils import SECRET_HASH_REGISTRY_PATH
 
@@ -8,21 +7,17 @@ from secrecy_utils import SECRET_HASH_REGISTRY_PATH
 class AarEvidenceChainInvariant(InvariantChecker):
     """Enforces: AAR evidence chain binds to contracts and secret registries."""
 
-    def _load_contract_hashes(self) -> list[str]:
-        contracts_dir = self.repo_root / "contracts/safety_contracts"
-        hashes = []
-        for file_path in iter_data_files(contracts_dir):
-            hashes.append(sha256_data_file(file_path))
-        return hashes
+    def _load_contract_hashes(self) -> frozenset[str]:
+        return self.data_file_hashes("contracts/safety_contracts")
 
     def _load_secret_registry_hash(self) -> str | None:
         registry_path = self.repo_root / SECRET_HASH_REGISTRY_PATH
         if not registry_path.exists():
             return None
-        return sha256_data_file(registry_path)
+        return self.hash_cache.sha256_data_file(registry_path)
 
     def check(self) -> InvariantCheck:
-        aars = load_aars(self.repo_root)
+        aars = self.artifacts.load(load_aars)
         if not aars:
             return InvariantCheck(
                 name="AAR_EVIDENCE_CHAIN",
@@ -32,12 +27,14 @@ class AarEvidenceChainInvariant(InvariantChecker):
 
         contract_hashes = self._load_contract_hashes()
         secret_registry_hash = self._load_secret_registry_hash()
-        aar_hashes = [sha256_canonical(aar["data"]) for aar in aars]
+        aar_hashes = {normalize_hash(aar["hash"]) for aar in aars}
 
         failures = []
         for aar in aars:
+            if self.fail_fast and failures:
+                break
             data = aar["data"]
-            file_path = str(aar["file"].relative_to(self.repo_root))
+            file_path = aar["file_rel"]
 
             claimed_contract_hash = (data.get("safety_contract") or {}).get("contract_hash")
             if claimed_contract_hash:
@@ -46,7 +43,7 @@ class AarEvidenceChainInvariant(InvariantChecker):
                         "file": file_path,
                         "reason": "No contract files found for claimed contract_hash",
                     })
-                elif not any(verify_hash(claimed_contract_hash, h) for h in contract_hashes):
+                elif normalize_hash(claimed_contract_hash) not in contract_hashes:
                     failures.append({
                         "file": file_path,
                         "reason": "AAR contract_hash does not match any contract file",
@@ -67,7 +64,7 @@ class AarEvidenceChainInvariant(InvariantChecker):
 
             previous_hash = (data.get("provenance") or {}).get("previous_aar_hash")
             if previous_hash:
-                if not any(verify_hash(previous_hash, h) for h in aar_hashes):
+                if normalize_hash(previous_hash) not in aar_hashes:
                     failures.append({
                         "file": file_path,
                         "reason": "previous_aar_hash not found in existing AARs",
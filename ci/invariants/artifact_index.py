@@ -0,0 +1,50 @@
+import threading
+from pathlib import Path
+from typing import Any, Callable, Iterable
+
+from evoalign.provenance import existing_git_commits
+from file_index import RepoFileIndex
+from provenance_utils import load_aars
+
+
+class ArtifactIndex:
+    """Per-run memo of artifact loaders, so each tree is walked and parsed once.
+
+    Invariants share the loaded records and must treat them as read-only.
+    Loader exceptions are not cached; every caller sees the loader raise.
+    """
+
+    def __init__(self, repo_root: Path) -> None:
+        self.repo_root = repo_root
+        self.files = RepoFileIndex()
+        self._results: dict[Callable, Any] = {}
+        self._locks: dict[Callable, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+        self._commit_exists: dict[str, bool] = {}
+        self._commits_lock = threading.Lock()
+
+    def load(self, loader: Callable[[Path], Any]) -> Any:
+        with self._locks_guard:
+            lock = self._locks.setdefault(loader, threading.Lock())
+        with lock:
+            if loader not in self._results:
+                self._results[loader] = loader(self.repo_root)
+            return self._results[loader]
+
+    def aar_index(self) -> dict[Any, dict]:
+        """aar_id -> AAR data for the loaded AARs, built once per run."""
+        return self.load(self._index_aars)
+
+    def _index_aars(self, repo_root: Path) -> dict[Any, dict]:
+        aars = self.load(load_aars)
+        return {aar["data"].get("aar_id"): aar["data"] for aar in aars if aar["data"].get("aar_id")}
+
+    def existing_commits(self, commits: Iterable[str | None]) -> set[str]:
+        """existing_git_commits, remembering each name so later invariants skip git for it."""
+        names = {commit for commit in commits if commit and isinstance(commit, str)}
+        with self._commits_lock:
+            unresolved = names - self._commit_exists.keys()
+            if unresolved:
+                found = existing_git_commits(unresolved, self.repo_root)
+                self._commit_exists.update((name, name in found) for name in unresolved)
+            return {name for name in names if self._commit_exists[name]}
@@ -1,16 +1,20 @@
 from dataclasses import dataclass
-from enum import Enum
+from enum import StrEnum
 from typing import Optional
 
+from artifact_index import ArtifactIndex
+from evoalign.provenance import HashCache, normalize_hash
+from file_utils import map_files
 
-class InvariantResult(Enum):
+
+class InvariantResult(StrEnum):
     PASS = "PASS"
     FAIL = "FAIL"
     WARN = "WARN"
     SKIP = "SKIP"
 
 
-@dataclass
+@dataclass(slots=True)
 class InvariantCheck:
     """Result of an invariant check."""
     name: str
@@ -30,8 +34,23 @@ class InvariantCheck:
 class InvariantChecker:
     """Base class for invariant checkers."""
 
-    def __init__(self, repo_root):
+    def __init__(
+        self,
+        repo_root,
+        hash_cache: HashCache | None = None,
+        artifacts: ArtifactIndex | None = None,
+        fail_fast: bool = False,
+    ):
         self.repo_root = repo_root
+        self.hash_cache = hash_cache or HashCache()
+        self.artifacts = artifacts or ArtifactIndex(repo_root)
+        # Checkers may stop scanning at their first failure; off by default so CI reports all.
+        self.fail_fast = fail_fast
+
+    def data_file_hashes(self, rel_dir: str) -> frozenset[str]:
+        """Normalized canonical hashes of every data file under rel_dir, for membership tests."""
+        files = self.artifacts.files.data_files(self.repo_root / rel_dir)
+        return frozenset(normalize_hash(digest) for digest in map_files(self.hash_cache.sha256_data_file, files))
 
     def check(self) -> InvariantCheck:
         raise NotImplementedError
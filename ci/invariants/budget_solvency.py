@@ -1,3 +1,5 @@
+from collections import defaultdict
+
 from base import InvariantCheck, InvariantChecker, InvariantResult
 from evoalign.context_lattice import ContextLatticeError
 from lattice_utils import (
@@ -16,7 +18,7 @@ class BudgetSolvencyInvariant(InvariantChecker):
 
     def check(self) -> InvariantCheck:
         try:
-            lattice, lattice_path = load_context_lattice(self.repo_root)
+            lattice, lattice_path = self.artifacts.load(load_context_lattice)
         except ContextLatticeError as exc:
             return InvariantCheck(
                 name="BUDGET_SOLVENCY",
@@ -24,7 +26,7 @@ class BudgetSolvencyInvariant(InvariantChecker):
                 message=str(exc),
             )
 
-        plans = load_oversight_plans(self.repo_root)
+        plans = self.artifacts.load(load_oversight_plans)
         if not plans:
             return InvariantCheck(
                 name="BUDGET_SOLVENCY",
@@ -32,7 +34,7 @@ class BudgetSolvencyInvariant(InvariantChecker):
                 message=f"No oversight plans found (lattice: {lattice_path.name})",
             )
 
-        contracts = load_safety_contracts(self.repo_root)
+        contracts = self.artifacts.load(load_safety_contracts)
         tolerances = extract_tolerances(contracts)
         if not tolerances:
             return InvariantCheck(
@@ -41,7 +43,7 @@ class BudgetSolvencyInvariant(InvariantChecker):
                 message="No safety contract tolerances found",
             )
 
-        fits = load_risk_fits(self.repo_root)
+        fits = self.artifacts.load(load_risk_fits)
         if not fits:
             return InvariantCheck(
                 name="BUDGET_SOLVENCY",
@@ -49,21 +51,27 @@ class BudgetSolvencyInvariant(InvariantChecker):
                 message="No risk fits found",
             )
 
-        hazards = sorted({
-            (tol.get("hazard_id"), tol.get("severity_id"))
-            for tol in tolerances
-            if tol.get("hazard_id") and tol.get("severity_id")
-        })
+        tolerances_by_key = defaultdict(list)
+        for tol in tolerances:
+            tolerances_by_key[(tol.get("hazard_id"), tol.get("severity_id"))].append(tol)
+        hazards = sorted(
+            (key, key_tolerances)
+            for key, key_tolerances in tolerances_by_key.items()
+            if key[0] and key[1]
+        )
+        fits_by_key = defaultdict(list)
+        for fit in fits:
+            fits_by_key[(fit["data"].get("hazard_id"), fit["data"].get("severity_id"))].append(fit)
 
         failures = []
         for plan in plans:
+            if self.fail_fast and failures:
+                break
             plan_context = plan["context_class"]
             plan_label = plan.get("plan_id") or plan_context
-            for hazard_id, severity_id in hazards:
+            for (hazard_id, severity_id), key_tolerances in hazards:
                 applicable_tolerances = []
-                for tol in tolerances:
-                    if tol.get("hazard_id") != hazard_id or tol.get("severity_id") != severity_id:
-                        continue
+                for tol in key_tolerances:
                     tol_context = tol.get("context_class")
                     if not tol_context:
                         failures.append({
@@ -92,7 +100,7 @@ class BudgetSolvencyInvariant(InvariantChecker):
                         "reason": "No tolerance covers plan context",
                         "hazard_id": hazard_id,
                         "severity_id": severity_id,
-                        "file": str(plan["file"].relative_to(self.repo_root)),
+                        "file": plan["file_rel"],
                     })
                     continue
 
@@ -114,24 +122,21 @@ class BudgetSolvencyInvariant(InvariantChecker):
                         "reason": "No valid tau values found",
                         "hazard_id": hazard_id,
                         "severity_id": severity_id,
-                        "file": str(plan["file"].relative_to(self.repo_root)),
+                        "file": plan["file_rel"],
                     })
                     continue
                 strictest_tau = min(tau_values)
 
                 applicable_fits = []
-                for fit in fits:
-                    fit_data = fit["data"]
-                    if fit_data.get("hazard_id") != hazard_id or fit_data.get("severity_id") != severity_id:
-                        continue
-                    fit_context = fit_data.get("context_class")
+                for fit in fits_by_key.get((hazard_id, severity_id), ()):
+                    fit_context = fit["data"].get("context_class")
                     if not fit_context:
                         failures.append({
                             "plan": plan_label,
                             "reason": "Risk fit missing context_class",
                             "hazard_id": hazard_id,
                             "severity_id": severity_id,
-                            "file": str(fit["file"].relative_to(self.repo_root)),
+                            "file": fit["file_rel"],
                         })
                         continue
                     try:
@@ -143,7 +148,7 @@ class BudgetSolvencyInvariant(InvariantChecker):
                             "reason": str(exc),
                             "hazard_id": hazard_id,
                             "severity_id": severity_id,
-                            "file": str(fit["file"].relative_to(self.repo_root)),
+                            "file": fit["file_rel"],
                         })
 
                 if not applicable_fits:
@@ -152,45 +157,61 @@ class BudgetSolvencyInvariant(InvariantChecker):
                         "reason": "No risk fit covers plan context",
                         "hazard_id": hazard_id,
                         "severity_id": severity_id,
-                        "file": str(plan["file"].relative_to(self.repo_root)),
+                        "file": plan["file_rel"],
                     })
                     continue
 
-                risks = []
+                # None until a fit's risk computes; -inf is itself a valid risk.
+                worst_risk: float | None = None
+                violating_fit = None
                 for fit in applicable_fits:
                     try:
-                        risk = compute_fit_risk(
-                            fit["data"] | {"file": str(fit["file"].relative_to(self.repo_root))},
-                            plan.get("channel_allocations"),
-                        )
-                        risks.append(risk)
+                        risk = compute_fit_risk(fit["data_with_file"], plan.get("channel_allocations"))
                     except Exception as exc:
                         failures.append({
                             "plan": plan_label,
                             "reason": str(exc),
                             "hazard_id": hazard_id,
                             "severity_id": severity_id,
-                            "file": str(fit["file"].relative_to(self.repo_root)),
+                            "file": fit["file_rel"],
                         })
+                        continue
+                    worst_risk = risk if worst_risk is None else max(worst_risk, risk)
+                    # A plan is insolvent once one fit exceeds tau; fail-fast runs stop there.
+                    if self.fail_fast and worst_risk > strictest_tau:
+                        violating_fit = fit
+                        break
 
-                if not risks:
+                if worst_risk is None:
                     failures.append({
                         "plan": plan_label,
                         "reason": "No computable risk from applicable fits",
                         "hazard_id": hazard_id,
                         "severity_id": severity_id,
-                        "file": str(plan["file"].relative_to(self.repo_root)),
+                        "file": plan["file_rel"],
                     })
                     continue
 
-                worst_risk = max(risks)
-                if worst_risk > strictest_tau:
+                if violating_fit is not None:
+                    # Later fits were not scored, so this is the first violation, not the worst.
+                    failures.append({
+                        "plan": plan_label,
+                        "reason": (
+                            f"Risk {worst_risk:.6g} exceeds tau {strictest_tau:.6g} "
+                            "(first violating fit; later fits not scored in fail-fast mode)"
+                        ),
+                        "hazard_id": hazard_id,
+                        "severity_id": severity_id,
+                        "file": plan["file_rel"],
+                        "fit_file": violating_fit["file_rel"],
+                    })
+                elif worst_risk > strictest_tau:
                     failures.append({
                         "plan": plan_label,
                         "reason": f"Risk {worst_risk:.6g} exceeds tau {strictest_tau:.6g}",
                         "hazard_id": hazard_id,
                         "severity_id": severity_id,
-                        "file": str(plan["file"].relative_to(self.repo_root)),
+                        "file": plan["file_rel"],
                     })
 
         if failures:
@@ -26,81 +26,144 @@ Invariants:
 - RUNTIME_CONFIG: Runtime configs match AAR stability/monitoring claims
 """
 
+import argparse
+import importlib
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
+from typing import Iterable
 
+from artifact_index import ArtifactIndex
 from base import InvariantResult
-from budget_solvency import BudgetSolvencyInvariant
-from context_lattice_governance import ContextLatticeGovernanceInvariant
-from context_registry import ContextRegistryInvariant
-from contract import ContractInvariant
-from evidence_governance import EvidenceGovernanceInvariant
-from fit_plan_aar_consistency import FitPlanAarConsistencyInvariant
-from fit_provenance_complete import FitProvenanceCompleteInvariant
-from fit_provenance_integrity import FitProvenanceIntegrityInvariant
-from promotion import PromotionInvariant
-from rollback import RollbackInvariant
-from salvage import SalvageInvariant
-from secret_registry_integrity import SecretRegistryIntegrityInvariant
-from secrecy import SecrecyInvariant
-from aar_evidence_chain import AarEvidenceChainInvariant
-from chronicle_governance import ChronicleGovernanceInvariant
-from lineage_integrity import LineageIntegrityInvariant
-from tamper_evidence import TamperEvidenceInvariant
-from runtime_config import RuntimeConfigInvariant
-from schema_validation import SchemaValidationInvariant
+from evoalign.provenance import HashCache
+from file_utils import MAX_FILE_WORKERS
 
 
+# Resolved as module.ClassName when each check runs, so unused modules are never imported.
 ALL_INVARIANTS = [
-    SchemaValidationInvariant,
-    SecretRegistryIntegrityInvariant,
-    SecrecyInvariant,
-    PromotionInvariant,
-    SalvageInvariant,
-    RollbackInvariant,
-    ContractInvariant,
-    ContextLatticeGovernanceInvariant,
-    ContextRegistryInvariant,
-    BudgetSolvencyInvariant,
-    EvidenceGovernanceInvariant,
-    FitProvenanceCompleteInvariant,
-    FitProvenanceIntegrityInvariant,
-    FitPlanAarConsistencyInvariant,
-    AarEvidenceChainInvariant,
-    LineageIntegrityInvariant,
-    ChronicleGovernanceInvariant,
-    TamperEvidenceInvariant,
-    RuntimeConfigInvariant,
+    "schema_validation.SchemaValidationInvariant",
+    "secret_registry_integrity.SecretRegistryIntegrityInvariant",
+    "secrecy.SecrecyInvariant",
+    "promotion.PromotionInvariant",
+    "salvage.SalvageInvariant",
+    "rollback.RollbackInvariant",
+    "contract.ContractInvariant",
+    "context_lattice_governance.ContextLatticeGovernanceInvariant",
+    "context_registry.ContextRegistryInvariant",
+    "budget_solvency.BudgetSolvencyInvariant",
+    "evidence_governance.EvidenceGovernanceInvariant",
+    "fit_provenance_complete.FitProvenanceCompleteInvariant",
+    "fit_provenance_integrity.FitProvenanceIntegrityInvariant",
+    "fit_plan_aar_consistency.FitPlanAarConsistencyInvariant",
+    "aar_evidence_chain.AarEvidenceChainInvariant",
+    "lineage_integrity.LineageIntegrityInvariant",
+    "chronicle_governance.ChronicleGovernanceInvariant",
+    "tamper_evidence.TamperEvidenceInvariant",
+    "runtime_config.RuntimeConfigInvariant",
 ]
 
 
-def run_all_invariants(repo_root: Path) -> dict:
-    results = []
-    all_passed = True
-
-    for invariant_class in ALL_INVARIANTS:
-        checker = invariant_class(repo_root)
-        result = checker.check()
-        results.append(result.to_dict())
-
-        if result.result == InvariantResult.FAIL:
-            all_passed = False
+def _load_invariant(spec: str) -> type:
+    module_name, class_name = spec.rsplit(".", 1)
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def _run_one(
+    spec: str, repo_root: Path, hash_cache: HashCache, artifacts: ArtifactIndex, fail_fast: bool = False
+) -> dict:
+    invariant_class = _load_invariant(spec)
+    checker = invariant_class(repo_root, hash_cache=hash_cache, artifacts=artifacts, fail_fast=fail_fast)
+    return checker.check().to_dict()
+
+
+def _invariant_modules() -> list[str]:
+    return [spec.rsplit(".", 1)[0] for spec in ALL_INVARIANTS]
+
+
+def _selected_invariants(only: Iterable[str] | None) -> list[str]:
+    if not only:
+        return ALL_INVARIANTS
+    modules = set(only)
+    unknown = modules - set(_invariant_modules())
+    if unknown:
+        raise ValueError(f"Unknown invariant module(s): {sorted(unknown)}")
+    return [spec for spec in ALL_INVARIANTS if spec.rsplit(".", 1)[0] in modules]
+
+
+def _digest_cache_path(cache_path: str | None, repo_root: Path) -> Path | None:
+    if not cache_path:
+        return None
+    path = Path(cache_path)
+    if path.resolve().is_relative_to(repo_root.resolve()):
+        raise ValueError(f"EVOALIGN_DIGEST_CACHE must be outside the repository under check: {path}")
+    return path
+
+
+def _collect(results: Iterable[dict], fail_fast: bool) -> list[dict]:
+    collected = []
+    for result in results:
+        collected.append(result)
+        if fail_fast and result["result"] == InvariantResult.FAIL:
+            break
+    return collected
+
+
+def run_all_invariants(repo_root: Path, only: Iterable[str] | None = None) -> dict:
+    # Invariants are independent; threads (not processes) so they share one HashCache
+    # and ArtifactIndex. Set INVARIANT_SERIAL=1 to run them one at a time when debugging.
+    # INVARIANT_FAIL_FAST=1 stops at the first failing invariant in ALL_INVARIANTS order
+    # and cancels those not yet started, for hooks that only need pass/fail. It is also
+    # passed to each checker, whose per-item loops then stop at their first failure.
+    # EVOALIGN_DIGEST_CACHE names a file that carries data-file digests across runs. It is
+    # trusted input, so a path inside the checked repo (where a commit could plant it) is refused.
+    # `only` names invariant modules (e.g. schema_validation) to run instead of all of them,
+    # so CI jobs that need a subset still share one process, one import of jsonschema and caches.
+    specs = _selected_invariants(only)
+    hash_cache = HashCache(_digest_cache_path(os.environ.get("EVOALIGN_DIGEST_CACHE"), repo_root))
+    fail_fast = os.environ.get("INVARIANT_FAIL_FAST", "0") != "0"
+    run = partial(
+        _run_one,
+        repo_root=repo_root,
+        hash_cache=hash_cache,
+        artifacts=ArtifactIndex(repo_root),
+        fail_fast=fail_fast,
+    )
+    if os.environ.get("INVARIANT_SERIAL", "0") != "0" or len(specs) < 2:
+        results = _collect(map(run, specs), fail_fast)
+    else:
+        with ThreadPoolExecutor(max_workers=min(len(specs), MAX_FILE_WORKERS)) as executor:
+            results = _collect(executor.map(run, specs), fail_fast)
+            executor.shutdown(cancel_futures=True)
+    hash_cache.save()
 
     return {
-        "all_passed": all_passed,
+        "all_passed": all(result["result"] != InvariantResult.FAIL for result in results),
         "results": results,
     }
 
 
-def main() -> int:
+def main(argv: list[str] | None = None) -> int:
+    parser = argparse.ArgumentParser(description="Run the EvoAlign CI invariants.")
+    parser.add_argument(
+        "--only",
+        nargs="+",
+        action="extend",
+        choices=_invariant_modules(),
+        metavar="MODULE",
+        help="Run only the invariants defined in these modules, e.g. --only schema_validation secrecy "
+        "(default: all)",
+    )
+    args = parser.parse_args(argv)
+
     repo_root = Path(os.environ.get("REPO_ROOT", ".")).resolve()
 
     print("EvoAlign Invariant Checker")
     print(f"Repo root: {repo_root}")
     print("=" * 60)
 
-    results = run_all_invariants(repo_root)
+    results = run_all_invariants(repo_root, only=args.only)
 
     for result in results["results"]:
         status_icon = {
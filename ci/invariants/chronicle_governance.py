@@ -1,8 +1,7 @@
 """Chronicle Governance Invariant: validates anomaly event provenance."""
 
 from base import InvariantCheck, InvariantChecker, InvariantResult
-from file_utils import iter_data_files, load_data_file
-from provenance_utils import load_aars
+from file_utils import load_data_file, map_files, relative_str
 
 
 class ChronicleGovernanceInvariant(InvariantChecker):
@@ -10,11 +9,15 @@ class ChronicleGovernanceInvariant(InvariantChecker):
 
     def _load_chronicle_entries(self) -> list[dict]:
         chronicle_dir = self.repo_root / "chronicle/events"
+        files = self.artifacts.files.data_files(chronicle_dir)
         entries = []
-        for file_path in iter_data_files(chronicle_dir):
-            data = load_data_file(file_path)
+        for file_path, data in zip(files, map_files(load_data_file, files)):
             if isinstance(data, dict):
-                entries.append({"file": file_path, "data": data})
+                entries.append({
+                    "file": file_path,
+                    "file_rel": relative_str(file_path, self.repo_root),
+                    "data": data,
+                })
         return entries
 
     def check(self) -> InvariantCheck:
@@ -27,12 +30,11 @@ class ChronicleGovernanceInvariant(InvariantChecker):
             )
 
         failures = []
-        aars = load_aars(self.repo_root)
-        aar_ids = {aar["data"].get("aar_id") for aar in aars if aar["data"].get("aar_id")}
+        aar_ids = self.artifacts.aar_index()
 
         for entry in entries:
             data = entry["data"]
-            file_path = str(entry["file"].relative_to(self.repo_root))
+            file_path = entry["file_rel"]
 
             # Check required fields
             if not data.get("release_id"):
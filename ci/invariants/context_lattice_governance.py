@@ -1,5 +1,12 @@
 from base import InvariantCheck, InvariantChecker, InvariantResult
-from file_utils import iter_data_files, load_data_file
+from file_utils import load_data_file, map_files, relative_str
+
+
+def _load_lattice_file(file_path):
+    try:
+        return load_data_file(file_path), None
+    except Exception as exc:
+        return None, exc
 
 
 class ContextLatticeGovernanceInvariant(InvariantChecker):
@@ -7,7 +14,7 @@ class ContextLatticeGovernanceInvariant(InvariantChecker):
 
     def check(self) -> InvariantCheck:
         lattice_dir = self.repo_root / "contracts/context_lattice"
-        lattice_files = iter_data_files(lattice_dir)
+        lattice_files = self.artifacts.files.data_files(lattice_dir)
         if not lattice_files:
             return InvariantCheck(
                 name="CONTEXT_LATTICE_GOVERNANCE",
@@ -16,32 +23,32 @@ class ContextLatticeGovernanceInvariant(InvariantChecker):
             )
 
         failures = []
-        for file_path in lattice_files:
-            try:
-                data = load_data_file(file_path)
-            except Exception as exc:
+        loaded = map_files(_load_lattice_file, lattice_files)
+        for file_path, (data, exc) in zip(lattice_files, loaded):
+            file_rel = relative_str(file_path, self.repo_root)
+            if exc is not None:
                 failures.append({
-                    "file": str(file_path.relative_to(self.repo_root)),
+                    "file": file_rel,
                     "reason": f"Failed to parse lattice file: {exc}",
                 })
                 continue
             if not isinstance(data, dict):
                 failures.append({
-                    "file": str(file_path.relative_to(self.repo_root)),
+                    "file": file_rel,
                     "reason": "Lattice file must be a mapping",
                 })
                 continue
             metadata = (data or {}).get("metadata", {})
             if not metadata.get("rfc_reference"):
                 failures.append({
-                    "file": str(file_path.relative_to(self.repo_root)),
+                    "file": file_rel,
                     "reason": "No rfc_reference in lattice metadata",
                 })
             approvals = metadata.get("approvals", [])
             signed = [a for a in approvals if a.get("signature")]
             if not signed:
                 failures.append({
-                    "file": str(file_path.relative_to(self.repo_root)),
+                    "file": file_rel,
                     "reason": "No signed approvals in lattice metadata",
                 })
 
@@ -18,7 +18,7 @@ class ContextRegistryInvariant(InvariantChecker):
 
     def check(self) -> InvariantCheck:
         try:
-            lattice, lattice_path = load_context_lattice(self.repo_root)
+            lattice, lattice_path = self.artifacts.load(load_context_lattice)
         except ContextLatticeError as exc:
             return InvariantCheck(
                 name="CONTEXT_REGISTRY",
@@ -26,7 +26,8 @@ class ContextRegistryInvariant(InvariantChecker):
                 message=str(exc),
             )
 
-        references = scan_context_classes(self.repo_root, self.SEARCH_PATHS)
+        files = self.artifacts.files
+        references = scan_context_classes(self.repo_root, self.SEARCH_PATHS, files.data_files, files.load_data_file)
         if not references:
             return InvariantCheck(
                 name="CONTEXT_REGISTRY",
@@ -34,11 +35,9 @@ class ContextRegistryInvariant(InvariantChecker):
                 message=f"No context_class references found (lattice: {lattice_path.name})",
             )
 
-        missing = [
-            ref
-            for ref in references
-            if ref["context_class"] not in lattice.contexts
-        ]
+        # Resolve each distinct class once; references only need filtering when some are unknown.
+        unknown = {ref["context_class"] for ref in references} - lattice.contexts.keys()
+        missing = [ref for ref in references if ref["context_class"] in unknown] if unknown else []
 
         if missing:
             return InvariantCheck(
@@ -1,55 +1,70 @@
-import json
 from pathlib import Path
-from typing import Any, Dict, Iterable, List
+from typing import Any, Callable, Dict, Iterable, Iterator, List
 
-import yaml
+from file_utils import iter_data_files, load_data_file, load_data_files, relative_str
 
 
-SUPPORTED_SUFFIXES = {".json", ".yaml", ".yml"}
+def _format_path(node: Any) -> str:
+    segments = []
+    while node is not None:
+        node, segment, is_index = node
+        segments.append((segment, is_index))
+    path: Any = ""
+    for segment, is_index in reversed(segments):
+        if is_index:
+            path = f"{path}[{segment}]"
+        else:
+            path = f"{path}.{segment}" if path else segment
+    return path
 
 
-def _find_context_classes(obj: Any, path: str = "") -> List[Dict[str, str]]:
-    results: List[Dict[str, str]] = []
-    if isinstance(obj, dict):
-        for key, value in obj.items():
-            next_path = f"{path}.{key}" if path else key
-            if key == "context_class" and isinstance(value, str):
-                results.append({"context_class": value, "path": next_path})
-            results.extend(_find_context_classes(value, next_path))
-    elif isinstance(obj, list):
-        for index, item in enumerate(obj):
-            next_path = f"{path}[{index}]"
-            results.extend(_find_context_classes(item, next_path))
-    return results
+def _iter_context_classes(obj: Any) -> Iterator[Dict[str, str]]:
+    # Depth-first with an explicit stack; children are pushed in reverse so entries
+    # come out in document order. Paths are (parent, segment, is_index) links that are
+    # only joined into a string for hits, and scalars that cannot hit are never pushed.
+    stack: List[tuple[Any, Any, bool]] = [(obj, None, False)]
+    while stack:
+        value, node, is_context_class = stack.pop()
+        if is_context_class:
+            yield {"context_class": value, "path": _format_path(node)}
+        elif isinstance(value, dict):
+            stack.extend(reversed([
+                (child, (node, key, False), key == "context_class" and isinstance(child, str))
+                for key, child in value.items()
+                if isinstance(child, (dict, list)) or (key == "context_class" and isinstance(child, str))
+            ]))
+        elif isinstance(value, list):
+            stack.extend(reversed([
+                (item, (node, index, True), False)
+                for index, item in enumerate(value)
+                if isinstance(item, (dict, list))
+            ]))
 
 
-def _load_file(file_path: Path) -> Any:
-    if file_path.suffix == ".json":
-        with file_path.open() as f:
-            return json.load(f)
-    with file_path.open() as f:
-        return yaml.safe_load(f)
+def _may_reference_context_class(file_path: Path) -> bool:
+    # A byte scan is far cheaper than a parse. Escapes can spell the key without the
+    # literal bytes, so any file containing a backslash is still parsed.
+    raw = file_path.read_bytes()
+    return b"context_class" in raw or b"\\" in raw
 
 
-def scan_context_classes(repo_root: Path, search_paths: Iterable[str]) -> List[Dict[str, str]]:
+def scan_context_classes(
+    repo_root: Path,
+    search_paths: Iterable[str],
+    list_files: Callable[[Path], Iterable[Path]] = iter_data_files,
+    parse: Callable[[Path], Any] = load_data_file,
+) -> List[Dict[str, str]]:
     results: List[Dict[str, str]] = []
-    for rel_path in search_paths:
-        base_path = repo_root / rel_path
-        if not base_path.exists():
-            continue
-        for file_path in base_path.rglob("*"):
-            if not file_path.is_file():
-                continue
-            if file_path.suffix not in SUPPORTED_SUFFIXES:
-                continue
-            try:
-                data = _load_file(file_path)
-            except Exception:
-                continue
-            for entry in _find_context_classes(data):
-                results.append({
-                    "context_class": entry["context_class"],
-                    "file": str(file_path.relative_to(repo_root)),
-                    "path": entry["path"],
-                })
+    # List every search path first so one pool parses the whole set.
+    files = [file_path for rel_path in search_paths for file_path in list_files(repo_root / rel_path)]
+
+    def parse_if_referenced(file_path: Path) -> Any:
+        return parse(file_path) if _may_reference_context_class(file_path) else None
+
+    for file_path, data in load_data_files(files, parse=parse_if_referenced, skip_errors=True):
+        file_rel = relative_str(file_path, repo_root)
+        results.extend(
+            {"context_class": entry["context_class"], "file": file_rel, "path": entry["path"]}
+            for entry in _iter_context_classes(data)
+        )
     return results
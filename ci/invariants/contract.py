@@ -1,9 +1,6 @@
-import json
-
-import yaml
-
 from base import InvariantCheck, InvariantChecker, InvariantResult
 from lattice_utils import load_lattice_index
+from file_utils import relative_str
 from evoalign.context_lattice import ContextLatticeError
 
 
@@ -29,16 +26,15 @@ class ContractInvariant(InvariantChecker):
                         "type": "modified",
                     })
         else:
-            for contract_file in contract_path.rglob("*.yaml"):
-                changes.append({
-                    "file": str(contract_file.relative_to(self.repo_root)),
-                    "type": "check_metadata",
-                })
-            for contract_file in contract_path.rglob("*.json"):
-                changes.append({
-                    "file": str(contract_file.relative_to(self.repo_root)),
-                    "type": "check_metadata",
-                })
+            # One shared walk instead of an rglob per suffix; YAML contracts still come first.
+            contract_files = self.artifacts.files.data_files(contract_path)
+            for suffix in (".yaml", ".json"):
+                for contract_file in contract_files:
+                    if contract_file.suffix == suffix:
+                        changes.append({
+                            "file": relative_str(contract_file, self.repo_root),
+                            "type": "check_metadata",
+                        })
 
         return changes
 
@@ -49,14 +45,11 @@ class ContractInvariant(InvariantChecker):
             return False, "Contract file not found"
 
         try:
-            if file_path.suffix == ".yaml":
-                with open(file_path) as f:
-                    contract = yaml.safe_load(f)
-            else:
-                with open(file_path) as f:
-                    contract = json.load(f)
+            contract = self.artifacts.files.load_data_file(file_path)
         except Exception as exc:
             return False, f"Failed to parse contract: {exc}"
+        if not isinstance(contract, dict):
+            return False, "Contract is not a mapping"
 
         metadata = contract.get("metadata", {})
 
@@ -102,7 +95,7 @@ class ContractInvariant(InvariantChecker):
             )
 
         try:
-            lattice_index = load_lattice_index(self.repo_root)
+            lattice_index = self.artifacts.load(load_lattice_index)
         except ContextLatticeError as exc:
             return InvariantCheck(
                 name="CONTRACT",
@@ -0,0 +1,41 @@
+import threading
+from pathlib import Path
+
+from typing import Any
+
+from file_utils import iter_data_files, load_data_file
+
+
+_MISSING = object()
+
+
+class RepoFileIndex:
+    """Per-run memo of data-file listings and parses, so each tree is walked and parsed once.
+
+    Parsed documents are shared between callers and must be treated as read-only.
+    Threads that miss the same entry together may both compute it; the first result
+    stored is the one every caller gets.
+    """
+
+    def __init__(self) -> None:
+        self._listings: dict[Path, tuple[Path, ...]] = {}
+        self._documents: dict[tuple[Path, int, int], Any] = {}
+        self._lock = threading.Lock()
+
+    def data_files(self, base_path: Path) -> tuple[Path, ...]:
+        files = self._listings.get(base_path)
+        if files is None:
+            files = tuple(iter_data_files(base_path))
+            with self._lock:
+                files = self._listings.setdefault(base_path, files)
+        return files
+
+    def load_data_file(self, file_path: Path) -> Any:
+        stat = file_path.stat()
+        key = (file_path, stat.st_mtime_ns, stat.st_size)
+        document = self._documents.get(key, _MISSING)
+        if document is _MISSING:
+            document = load_data_file(file_path)
+            with self._lock:
+                document = self._documents.setdefault(key, document)
+        return document
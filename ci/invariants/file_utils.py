@@ -1,25 +1,90 @@
-import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any, Callable, Iterable
 
-import yaml
+from evoalign.provenance import iter_files, json_loads, relative_str, yaml_loads
 
-DATA_SUFFIXES = {".json", ".yaml", ".yml"}
+DATA_SUFFIXES = frozenset({".json", ".yaml", ".yml"})
+JSON_SUFFIXES = frozenset({".json"})
+MAX_FILE_WORKERS = min(32, (os.cpu_count() or 1) + 4)
+
+
+def load_yaml(file_path: Path):
+    return yaml_loads(file_path.read_bytes())
 
 
 def load_data_file(file_path: Path):
+    # Parse from bytes so decoding happens in C rather than through a text wrapper.
     if file_path.suffix == ".json":
-        with file_path.open() as f:
-            return json.load(f)
-    with file_path.open() as f:
-        return yaml.safe_load(f)
-
-
-def iter_data_files(base_path: Path):
-    if not base_path.exists():
-        return []
-    files = [
-        path
-        for path in base_path.rglob("*")
-        if path.is_file() and path.suffix in DATA_SUFFIXES
-    ]
-    return sorted(files)
+        return json_loads(file_path.read_bytes())
+    return load_yaml(file_path)
+
+
+def iter_data_files(base_path: Path, suffixes: frozenset[str] = DATA_SUFFIXES):
+    return iter_files(base_path, suffixes)
+
+
+def iter_json_files(base_path: Path):
+    """iter_data_files restricted to .json, filtered on entry names during the walk."""
+    return iter_data_files(base_path, JSON_SUFFIXES)
+
+
+# One file pool for the whole process: invariants running in parallel share it, so file
+# work adds at most MAX_FILE_WORKERS threads however many invariants call map_files.
+_file_executor: ThreadPoolExecutor | None = None
+_file_executor_lock = threading.Lock()
+_file_worker = threading.local()
+
+
+def _mark_file_worker() -> None:
+    _file_worker.active = True
+
+
+def _shared_file_executor() -> ThreadPoolExecutor:
+    global _file_executor
+    with _file_executor_lock:
+        if _file_executor is None:
+            _file_executor = ThreadPoolExecutor(
+                max_workers=MAX_FILE_WORKERS,
+                thread_name_prefix="evoalign-files",
+                initializer=_mark_file_worker,
+            )
+        return _file_executor
+
+
+def map_files(fn, paths) -> list:
+    """Apply fn to each path on the shared file pool, returning results in input order."""
+    paths = list(paths)
+    # Calls made from a pool worker run inline; waiting on the pool there could deadlock it.
+    if len(paths) < 2 or getattr(_file_worker, "active", False):
+        return [fn(path) for path in paths]
+    return list(_shared_file_executor().map(fn, paths))
+
+
+_PARSE_FAILED = object()
+
+
+def load_data_files(
+    paths: Iterable[Path],
+    parse: Callable[[Path], Any] = load_data_file,
+    skip_errors: bool = False,
+) -> list[tuple[Path, Any]]:
+    """Parse paths on the thread pool, returning (path, data) pairs in input order.
+
+    With skip_errors, files that fail to parse are dropped; otherwise the first
+    failure in input order propagates, as it would from a sequential loop.
+    """
+    paths = list(paths)
+    if skip_errors:
+        def try_parse(path: Path) -> Any:
+            try:
+                return parse(path)
+            except Exception:
+                return _PARSE_FAILED
+
+        results = map_files(try_parse, paths)
+    else:
+        results = map_files(parse, paths)
+    return [(path, data) for path, data in zip(paths, results) if data is not _PARSE_FAILED]
@@ -5,7 +5,7 @@ from provenance_utils import load_risk_fits
 class FitProvenanceCompleteInvariant(InvariantChecker):
     """Enforces: risk fit provenance fields are present and non-placeholder."""
 
-    REQUIRED_FIELDS = [
+    REQUIRED_FIELDS = (
         "provenance_version",
         "rfc_reference",
         "approvals",
@@ -20,19 +20,24 @@ class FitProvenanceCompleteInvariant(InvariantChecker):
         "config_hash",
         "dataset_hashes",
         "random_seeds",
-    ]
+    )
 
-    PLACEHOLDERS = {"", "deadbeef", "0000000", "placeholder", "tbd"}
+    PLACEHOLDERS = frozenset({"", "deadbeef", "0000000", "placeholder", "tbd"})
+    _PLACEHOLDER_MAX_LEN = max(map(len, PLACEHOLDERS))
 
     def _is_placeholder(self, value) -> bool:
         if value is None:
             return True
-        if isinstance(value, str):
-            return value.strip().lower() in self.PLACEHOLDERS
-        return False
+        if not isinstance(value, str):
+            return False
+        # Real hashes and ids are longer than any placeholder even after stripping, so they
+        # skip the strip/lower copies; lower() never shortens a string.
+        if len(value) > self._PLACEHOLDER_MAX_LEN and not value[0].isspace() and not value[-1].isspace():
+            return False
+        return value.strip().lower() in self.PLACEHOLDERS
 
     def check(self) -> InvariantCheck:
-        fits = load_risk_fits(self.repo_root)
+        fits = self.artifacts.load(load_risk_fits)
         if not fits:
             return InvariantCheck(
                 name="FIT_PROVENANCE_COMPLETE",
@@ -42,13 +47,16 @@ class FitProvenanceCompleteInvariant(InvariantChecker):
 
         failures = []
         for fit in fits:
+            if self.fail_fast and failures:
+                break
             fit_data = fit["data"]
             fit_id = fit_data.get("fit_id")
+            file_rel = fit["file_rel"]
             provenance = fit_data.get("provenance")
             if not isinstance(provenance, dict):
                 failures.append({
                     "fit_id": fit_id,
-                    "file": str(fit["file"].relative_to(self.repo_root)),
+                    "file": file_rel,
                     "reason": "Missing provenance block",
                 })
                 continue
@@ -58,7 +66,7 @@ class FitProvenanceCompleteInvariant(InvariantChecker):
                 if self._is_placeholder(value):
                     failures.append({
                         "fit_id": fit_id,
-                        "file": str(fit["file"].relative_to(self.repo_root)),
+                        "file": file_rel,
                         "reason": f"Missing or placeholder '{field}'",
                     })
 
@@ -66,7 +74,7 @@ class FitProvenanceCompleteInvariant(InvariantChecker):
             if not isinstance(dataset_hashes, dict) or not dataset_hashes:
                 failures.append({
                     "fit_id": fit_id,
-                    "file": str(fit["file"].relative_to(self.repo_root)),
+                    "file": file_rel,
                     "reason": "dataset_hashes must be a non-empty object",
                 })
 
@@ -74,7 +82,7 @@ class FitProvenanceCompleteInvariant(InvariantChecker):
             if not isinstance(random_seeds, list) or not random_seeds:
                 failures.append({
                     "fit_id": fit_id,
-                    "file": str(fit["file"].relative_to(self.repo_root)),
+                    "file": file_rel,
                     "reason": "random_seeds must be a non-empty array",
                 })
 
@@ -82,7 +90,7 @@ class FitProvenanceCompleteInvariant(InvariantChecker):
             if not isinstance(approvals, list) or not approvals:
                 failures.append({
                     "fit_id": fit_id,
-                    "file": str(fit["file"].relative_to(self.repo_root)),
+                    "file": file_rel,
                     "reason": "approvals must be a non-empty array",
                 })
 
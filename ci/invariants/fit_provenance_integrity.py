@@ -1,5 +1,5 @@
 from base import InvariantCheck, InvariantChecker, InvariantResult
-from evoalign.provenance import git_commit_exists, verify_hash
+from evoalign.provenance import normalize_hash, verify_hash
 from provenance_utils import (
     load_dataset_manifests,
     load_eval_runs,
@@ -7,14 +7,20 @@ from provenance_utils import (
     load_risk_fits,
     load_suite_sets,
     load_sweeps,
+    sorted_seeds,
 )
 
 
+def _normalized(value: object) -> str | None:
+    # None for empty and non-string values, which never match any hash.
+    return normalize_hash(value) if value and isinstance(value, str) else None
+
+
 class FitProvenanceIntegrityInvariant(InvariantChecker):
     """Enforces: fit provenance references exist and hashes match manifests."""
 
     def check(self) -> InvariantCheck:
-        fits = load_risk_fits(self.repo_root)
+        fits = self.artifacts.load(load_risk_fits)
         if not fits:
             return InvariantCheck(
                 name="FIT_PROVENANCE_INTEGRITY",
@@ -22,28 +28,45 @@ class FitProvenanceIntegrityInvariant(InvariantChecker):
                 message="No risk fits found",
             )
 
-        registry = load_registry(self.repo_root)
-        suite_sets = load_suite_sets(self.repo_root)
-        datasets = load_dataset_manifests(self.repo_root)
-        eval_runs = load_eval_runs(self.repo_root)
-        sweeps = load_sweeps(self.repo_root)
+        registry = self.artifacts.load(load_registry)
+        suite_sets = self.artifacts.load(load_suite_sets)
+        datasets = self.artifacts.load(load_dataset_manifests)
+        eval_runs = self.artifacts.load(load_eval_runs)
+        sweeps = self.artifacts.load(load_sweeps)
 
         failures = []
+
         registry_suites = None
         registry_hash = None
         registry_missing = registry is None
         if registry:
             registry_suites = {suite.get("suite_id") for suite in registry["data"].get("suites", [])}
-            registry_hash = registry["hash"]
+            registry_hash = normalize_hash(registry["hash"])
+
+        # Each manifest hash is normalized once, not once per fit that cites the dataset;
+        # a malformed hash on a manifest no fit cites is never compared.
+        manifest_hashes = {
+            dataset_id: _normalized(manifest["data"].get("dataset_hash"))
+            for dataset_id, manifest in datasets.items()
+        }
+
+        fit_commits = self.artifacts.existing_commits(
+            fit["data"]["provenance"].get("fit_generator_commit")
+            for fit in fits
+            if isinstance(fit["data"].get("provenance"), dict)
+        )
 
         for fit in fits:
+            if self.fail_fast and failures:
+                break
             fit_data = fit["data"]
             fit_id = fit_data.get("fit_id")
+            file_rel = fit["file_rel"]
             provenance = fit_data.get("provenance")
             if not isinstance(provenance, dict):
                 failures.append({
                     "fit_id": fit_id,
-                    "file": str(fit["file"].relative_to(self.repo_root)),
+                    "file": file_rel,
                     "reason": "Missing provenance block",
                 })
                 continue
@@ -51,15 +74,15 @@ class FitProvenanceIntegrityInvariant(InvariantChecker):
             if registry_missing:
                 failures.append({
                     "fit_id": fit_id,
-                    "file": str(fit["file"].relative_to(self.repo_root)),
+                    "file": file_rel,
                     "reason": "Suite registry manifest missing",
                 })
 
             commit = provenance.get("fit_generator_commit")
-            if not git_commit_exists(commit, self.repo_root):
+            if not isinstance(commit, str) or commit not in fit_commits:
                 failures.append({
                     "fit_id": fit_id,
-                    "file": str(fit["file"].relative_to(self.repo_root)),
+                    "file": file_rel,
                     "reason": f"fit_generator_commit not found: {commit}",
                 })
 
@@ -68,7 +91,7 @@ class FitProvenanceIntegrityInvariant(InvariantChecker):
             if not eval_run:
                 failures.append({
                     "fit_id": fit_id,
-                    "file": str(fit["file"].relative_to(self.repo_root)),
+                    "file": file_rel,
                     "reason": f"Missing eval_run manifest '{eval_run_id}'",
                 })
                 continue
@@ -76,7 +99,7 @@ class FitProvenanceIntegrityInvariant(InvariantChecker):
             if not verify_hash(provenance.get("eval_run_hash"), eval_run["hash"]):
                 failures.append({
                     "fit_id": fit_id,
-                    "file": str(fit["file"].relative_to(self.repo_root)),
+                    "file": file_rel,
                     "reason": "eval_run_hash mismatch",
                 })
 
@@ -85,82 +108,83 @@ class FitProvenanceIntegrityInvariant(InvariantChecker):
             if not sweep:
                 failures.append({
                     "fit_id": fit_id,
-                    "file": str(fit["file"].relative_to(self.repo_root)),
+                    "file": file_rel,
                     "reason": f"Missing sweep manifest '{sweep_id}'",
                 })
             else:
+                sweep_data = sweep["data"]
                 if not verify_hash(provenance.get("sweep_hash"), sweep["hash"]):
                     failures.append({
                         "fit_id": fit_id,
-                        "file": str(fit["file"].relative_to(self.repo_root)),
+                        "file": file_rel,
                         "reason": "sweep_hash mismatch",
                     })
-                if sweep["data"].get("hazard_id") != fit_data.get("hazard_id"):
+                if sweep_data.get("hazard_id") != fit_data.get("hazard_id"):
                     failures.append({
                         "fit_id": fit_id,
-                        "file": str(fit["file"].relative_to(self.repo_root)),
+                        "file": file_rel,
                         "reason": "sweep hazard_id mismatch",
                     })
-                if sweep["data"].get("severity_id") != fit_data.get("severity_id"):
+                if sweep_data.get("severity_id") != fit_data.get("severity_id"):
                     failures.append({
                         "fit_id": fit_id,
-                        "file": str(fit["file"].relative_to(self.repo_root)),
+                        "file": file_rel,
                         "reason": "sweep severity_id mismatch",
                     })
-                if sweep["data"].get("context_class") != fit_data.get("context_class"):
+                if sweep_data.get("context_class") != fit_data.get("context_class"):
                     failures.append({
                         "fit_id": fit_id,
-                        "file": str(fit["file"].relative_to(self.repo_root)),
+                        "file": file_rel,
                         "reason": "sweep context_class mismatch",
                     })
-                if eval_run_id not in (sweep["data"].get("eval_run_ids") or []):
+                if eval_run_id not in sweep["eval_run_ids"]:
                     failures.append({
                         "fit_id": fit_id,
-                        "file": str(fit["file"].relative_to(self.repo_root)),
+                        "file": file_rel,
                         "reason": "sweep missing eval_run_id reference",
                     })
-                sweep_hashes = sweep["data"].get("eval_run_hashes") or {}
+                sweep_hashes = sweep_data.get("eval_run_hashes") or {}
                 if eval_run_id and not verify_hash(eval_run["hash"], sweep_hashes.get(eval_run_id)):
                     failures.append({
                         "fit_id": fit_id,
-                        "file": str(fit["file"].relative_to(self.repo_root)),
+                        "file": file_rel,
                         "reason": "sweep eval_run_hash mismatch",
                     })
 
             suite_set_id = provenance.get("suite_set_id")
+            suite_set_hash = provenance.get("suite_set_hash")
             suite_set = suite_sets.get(suite_set_id)
             if not suite_set:
                 failures.append({
                     "fit_id": fit_id,
-                    "file": str(fit["file"].relative_to(self.repo_root)),
+                    "file": file_rel,
                     "reason": f"Missing suite_set manifest '{suite_set_id}'",
                 })
             else:
-                if not verify_hash(provenance.get("suite_set_hash"), suite_set["hash"]):
+                if not verify_hash(suite_set_hash, suite_set["hash"]):
                     failures.append({
                         "fit_id": fit_id,
-                        "file": str(fit["file"].relative_to(self.repo_root)),
+                        "file": file_rel,
                         "reason": "suite_set_hash mismatch",
                     })
-                if registry_hash and not verify_hash(suite_set["data"].get("registry_hash"), registry_hash):
+                if registry_hash and normalize_hash(suite_set["data"].get("registry_hash")) != registry_hash:
                     failures.append({
                         "fit_id": fit_id,
-                        "file": str(fit["file"].relative_to(self.repo_root)),
+                        "file": file_rel,
                         "reason": "suite_set registry_hash mismatch",
                     })
                 if registry_suites is not None:
-                    suite_ids = set(suite_set["data"].get("suite_ids") or [])
-                    if not suite_ids.issubset(registry_suites):
+                    if not suite_set["suite_ids"].issubset(registry_suites):
                         failures.append({
                             "fit_id": fit_id,
-                            "file": str(fit["file"].relative_to(self.repo_root)),
+                            "file": file_rel,
                             "reason": "suite_set references unknown suite_id",
                         })
 
-            if registry_hash and not verify_hash(provenance.get("suite_registry_hash"), registry_hash):
+            if registry_hash and normalize_hash(provenance.get("suite_registry_hash")) != registry_hash:
                 failures.append({
                     "fit_id": fit_id,
-                    "file": str(fit["file"].relative_to(self.repo_root)),
+                    "file": file_rel,
                     "reason": "suite_registry_hash mismatch",
                 })
 
@@ -168,53 +192,55 @@ class FitProvenanceIntegrityInvariant(InvariantChecker):
             if eval_run_data.get("suite_set_id") != suite_set_id:
                 failures.append({
                     "fit_id": fit_id,
-                    "file": str(fit["file"].relative_to(self.repo_root)),
+                    "file": file_rel,
                     "reason": "eval_run suite_set_id mismatch",
                 })
-            if not verify_hash(provenance.get("suite_set_hash"), eval_run_data.get("suite_set_hash")):
+            if not verify_hash(suite_set_hash, eval_run_data.get("suite_set_hash")):
                 failures.append({
                     "fit_id": fit_id,
-                    "file": str(fit["file"].relative_to(self.repo_root)),
+                    "file": file_rel,
                     "reason": "eval_run suite_set_hash mismatch",
                 })
             if not verify_hash(provenance.get("config_hash"), eval_run_data.get("config_hash")):
                 failures.append({
                     "fit_id": fit_id,
-                    "file": str(fit["file"].relative_to(self.repo_root)),
+                    "file": file_rel,
                     "reason": "config_hash mismatch",
                 })
 
-            random_seeds = provenance.get("random_seeds") or []
-            run_seeds = eval_run_data.get("random_seeds") or []
-            if sorted(random_seeds) != sorted(run_seeds):
-                failures.append({
-                    "fit_id": fit_id,
-                    "file": str(fit["file"].relative_to(self.repo_root)),
-                    "reason": "random_seeds mismatch",
-                })
+            # Fits usually copy the run's seeds verbatim, so an identical list skips the sort;
+            # seeds that cannot be sorted only match that way.
+            random_seeds = provenance.get("random_seeds")
+            if random_seeds != eval_run_data.get("random_seeds"):
+                run_seeds = eval_run["sorted_seeds"]
+                if run_seeds is None or sorted_seeds(random_seeds) != run_seeds:
+                    failures.append({
+                        "fit_id": fit_id,
+                        "file": file_rel,
+                        "reason": "random_seeds mismatch",
+                    })
 
             dataset_hashes = provenance.get("dataset_hashes") or {}
             run_dataset_hashes = eval_run_data.get("dataset_hashes") or {}
             for dataset_id, hash_value in dataset_hashes.items():
-                manifest = datasets.get(dataset_id)
-                if not manifest:
+                if dataset_id not in manifest_hashes:
                     failures.append({
                         "fit_id": fit_id,
-                        "file": str(fit["file"].relative_to(self.repo_root)),
+                        "file": file_rel,
                         "reason": f"Missing dataset manifest '{dataset_id}'",
                     })
                     continue
-                dataset_hash = manifest["data"].get("dataset_hash")
-                if not verify_hash(hash_value, dataset_hash):
+                claimed = _normalized(hash_value)
+                if claimed is None or claimed != manifest_hashes[dataset_id]:
                     failures.append({
                         "fit_id": fit_id,
-                        "file": str(fit["file"].relative_to(self.repo_root)),
+                        "file": file_rel,
                         "reason": f"dataset_hash mismatch for '{dataset_id}'",
                     })
-                if not verify_hash(hash_value, run_dataset_hashes.get(dataset_id)):
+                if claimed is None or claimed != _normalized(run_dataset_hashes.get(dataset_id)):
                     failures.append({
                         "fit_id": fit_id,
-                        "file": str(fit["file"].relative_to(self.repo_root)),
+                        "file": file_rel,
                         "reason": f"eval_run dataset_hash mismatch for '{dataset_id}'",
                     })
 
@@ -2,9 +2,9 @@ from pathlib import Path
 from typing import Any, Mapping
 
 from evoalign.context_lattice import ContextLattice, ContextLatticeError
-from evoalign.provenance import sha256_data_file
+from evoalign.provenance import sha256_canonical
 
-from file_utils import iter_data_files, load_data_file
+from file_utils import iter_data_files, iter_json_files, load_data_files, relative_str
 
 
 def load_context_lattice(repo_root: Path) -> tuple[ContextLattice, Path]:
@@ -28,8 +28,7 @@ def load_lattice_index(repo_root: Path) -> dict:
     index = {}
     if not lattice_dir.exists():
         return index
-    for file_path in iter_data_files(lattice_dir):
-        data = load_data_file(file_path)
+    for file_path, data in load_data_files(iter_data_files(lattice_dir)):
         if not isinstance(data, dict):
             continue
         version = data.get("version")
@@ -39,20 +38,17 @@ def load_lattice_index(repo_root: Path) -> dict:
             raise ContextLatticeError(f"Duplicate lattice version '{version}' in {file_path}")
         index[version] = {
             "path": file_path,
-            "hash": sha256_data_file(file_path).replace("sha256:", ""),
+            "hash": sha256_canonical(data).replace("sha256:", ""),
         }
     return index
 
 
 def load_safety_contracts(repo_root: Path) -> list:
     contracts = []
-    for file_path in iter_data_files(repo_root / "contracts/safety_contracts"):
-        try:
-            data = load_data_file(file_path)
-        except Exception:
-            continue
+    contract_files = iter_data_files(repo_root / "contracts/safety_contracts")
+    for file_path, data in load_data_files(contract_files, skip_errors=True):
         if isinstance(data, dict):
-            contracts.append({"file": file_path, "data": data})
+            contracts.append({"file": file_path, "file_rel": relative_str(file_path, repo_root), "data": data})
     return contracts
 
 
@@ -75,45 +71,46 @@ def extract_tolerances(contracts: list) -> list:
 def load_risk_fits(repo_root: Path) -> list:
     fits = []
     fits_dir = repo_root / "control_plane/governor/risk_fits"
-    for file_path in iter_data_files(fits_dir):
-        if file_path.suffix != ".json":
-            continue
-        try:
-            data = load_data_file(file_path)
-        except Exception:
-            continue
+    for file_path, data in load_data_files(iter_json_files(fits_dir), skip_errors=True):
         if isinstance(data, list):
             items = data
         else:
             items = [data]
+        file_rel = relative_str(file_path, repo_root)
         for fit in items:
             if not isinstance(fit, dict):
                 continue
-            fits.append({"file": file_path, "data": fit})
+            # compute_fit_risk reports errors against fit["file"]; merge once here, not per plan.
+            fits.append({
+                "file": file_path,
+                "file_rel": file_rel,
+                "data": fit,
+                "data_with_file": fit | {"file": file_rel},
+            })
     return fits
 
 
+# Checked in order: the first key present decides how a plan file is laid out.
+_PLAN_LIST_KEYS = ("plans_by_context", "plans")
+
+
 def extract_plan_entries(data: object) -> list:
     if isinstance(data, list):
         return data
-    if isinstance(data, dict):
-        if "plans_by_context" in data:
-            return data.get("plans_by_context") or []
-        if "plans" in data:
-            return data.get("plans") or []
-        if "context_class" in data:
-            return [data]
-    return []
+    if not isinstance(data, dict):
+        return []
+    for key in _PLAN_LIST_KEYS:
+        # Membership already proved the key present; index rather than probe again with get().
+        if key in data:
+            return data[key] or []
+    return [data] if "context_class" in data else []
 
 
 def load_oversight_plans(repo_root: Path) -> list:
     plans = []
     plans_dir = repo_root / "control_plane/governor/oversight_plans"
-    for file_path in iter_data_files(plans_dir):
-        try:
-            data = load_data_file(file_path)
-        except Exception:
-            continue
+    for file_path, data in load_data_files(iter_data_files(plans_dir), skip_errors=True):
+        file_rel = relative_str(file_path, repo_root)
         for entry in extract_plan_entries(data):
             if not isinstance(entry, dict):
                 continue
@@ -123,6 +120,7 @@ def load_oversight_plans(repo_root: Path) -> list:
             channel_allocations = entry.get("channel_allocations") or {}
             plans.append({
                 "file": file_path,
+                "file_rel": file_rel,
                 "context_class": context_class,
                 "plan_id": entry.get("plan_id"),
                 "channel_allocations": channel_allocations,
@@ -138,25 +136,32 @@ def get_numeric(value, field_name: str, source: str) -> float:
 
 
 def compute_fit_risk(fit: Mapping[str, Any], channel_allocations: dict | None) -> float:
+    source = fit["file"]
     epsilon = fit.get("conservative_epsilon_high", fit.get("epsilon_high"))
-    epsilon_value = get_numeric(epsilon, "conservative_epsilon_high", fit["file"])
-    risk = epsilon_value
+    risk = get_numeric(epsilon, "conservative_epsilon_high", source)
 
     if channel_allocations is None:
         return risk
     if not isinstance(channel_allocations, dict):
-        raise ValueError(f"channel_allocations must be a dict in {fit['file']}")
+        raise ValueError(f"channel_allocations must be a dict in {source}")
 
     k_low_default = fit.get("conservative_k_low", fit.get("k_low"))
     k_low_by_channel = fit.get("k_low_by_channel") or {}
 
+    # Field names are only formatted on the error path; this loop runs once per fit per plan.
     for channel, allocation in channel_allocations.items():
-        allocation_value = get_numeric(allocation, f"channel_allocations[{channel}]", fit["file"])
+        try:
+            allocation_value = float(allocation)
+        except (TypeError, ValueError):
+            allocation_value = get_numeric(allocation, f"channel_allocations[{channel}]", source)
         if allocation_value <= 0:
-            raise ValueError(f"channel_allocations[{channel}] must be > 0 in {fit['file']}")
+            raise ValueError(f"channel_allocations[{channel}] must be > 0 in {source}")
         k_low = k_low_by_channel.get(channel, k_low_default)
         if k_low is None:
             continue
-        risk += get_numeric(k_low, f"k_low[{channel}]", fit["file"]) / allocation_value
+        try:
+            risk += float(k_low) / allocation_value
+        except (TypeError, ValueError):
+            risk += get_numeric(k_low, f"k_low[{channel}]", source) / allocation_value
 
     return risk
@@ -0,0 +1,22 @@
+from pathlib import Path
+
+from file_utils import iter_data_files, iter_json_files, load_data_files, relative_str
+
+
+def load_ledger_entries(repo_root: Path) -> list[dict]:
+    ledger_dir = repo_root / "control_plane/ledger"
+    entries = []
+    # Ledger checks have always ignored entries that do not parse.
+    for file_path, data in load_data_files(iter_json_files(ledger_dir), skip_errors=True):
+        if isinstance(data, dict):
+            entries.append({"file": file_path, "file_rel": relative_str(file_path, repo_root), "data": data})
+    return entries
+
+
+def load_lineage_entries(repo_root: Path) -> list[dict]:
+    lineage_dir = repo_root / "lineage"
+    return [
+        {"file": file_path, "file_rel": relative_str(file_path, repo_root), "data": data}
+        for file_path, data in load_data_files(iter_data_files(lineage_dir))
+        if isinstance(data, dict)
+    ]
@@ -1,24 +1,15 @@
 """Lineage Integrity Invariant: validates ledger entry provenance and chain."""
 
 from base import InvariantCheck, InvariantChecker, InvariantResult
-from evoalign.provenance import sha256_canonical, verify_hash
-from file_utils import iter_data_files, load_data_file
+from evoalign.provenance import normalize_hash
+from ledger_utils import load_lineage_entries
 
 
 class LineageIntegrityInvariant(InvariantChecker):
     """Enforces: lineage entries have valid provenance and chain integrity."""
 
-    def _load_lineage_entries(self) -> list[dict]:
-        lineage_dir = self.repo_root / "lineage"
-        entries = []
-        for file_path in iter_data_files(lineage_dir):
-            data = load_data_file(file_path)
-            if isinstance(data, dict):
-                entries.append({"file": file_path, "data": data})
-        return entries
-
     def check(self) -> InvariantCheck:
-        entries = self._load_lineage_entries()
+        entries = self.artifacts.load(load_lineage_entries)
         if not entries:
             return InvariantCheck(
                 name="LINEAGE_INTEGRITY",
@@ -27,12 +18,16 @@ class LineageIntegrityInvariant(InvariantChecker):
             )
 
         failures = []
-        entry_hashes = {e["data"].get("entry_id"): sha256_canonical(e["data"]) for e in entries}
+        # As before, only the last entry per entry_id can be chained to. Hashes go through the
+        # shared cache, so unchanged entries are not re-encoded when it persists across runs.
+        chainable = {e["data"].get("entry_id"): e for e in entries}.values()
+        entry_hash_set = {normalize_hash(self.hash_cache.sha256_parsed(e["file"], e["data"])) for e in chainable}
 
         for entry in entries:
+            if self.fail_fast and failures:
+                break
             data = entry["data"]
-            file_path = str(entry["file"].relative_to(self.repo_root))
-            entry_id = data.get("entry_id")
+            file_path = entry["file_rel"]
 
             # Check required provenance
             provenance = data.get("provenance")
@@ -57,8 +52,7 @@ class LineageIntegrityInvariant(InvariantChecker):
             # Check previous_entry_hash chain integrity
             prev_hash = data.get("previous_entry_hash")
             if prev_hash:
-                found = any(verify_hash(prev_hash, h) for h in entry_hashes.values())
-                if not found:
+                if normalize_hash(prev_hash) not in entry_hash_set:
                     failures.append({
                         "file": file_path,
                         "reason": "previous_entry_hash not found in lineage entries",
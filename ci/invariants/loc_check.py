@@ -1,17 +1,29 @@
 #!/usr/bin/env python3
 import os
 from pathlib import Path
+from typing import Iterable
 
 DEFAULT_MAX_LOC = 350
 DEFAULT_EXCLUDED_DIRS = {"tests", "types", ".git", ".venv", "__pycache__", "venv"}
 
 
 def count_loc(file_path: Path) -> int:
-    return len(file_path.read_text().splitlines())
+    data = file_path.read_bytes()
+    # Count newlines on the raw bytes; a final line without one still counts.
+    loc = data.count(b"\n")
+    if data and not data.endswith(b"\n"):
+        loc += 1
+    return loc
 
 
-def collect_python_files(repo_root: Path) -> list[Path]:
-    return sorted(repo_root.rglob("*.py"))
+def collect_python_files(repo_root: Path, excluded_dirs: Iterable[str] = ()) -> list[Path]:
+    excluded = set(excluded_dirs)
+    files = []
+    for dirpath, dirnames, filenames in os.walk(repo_root):
+        # Prune excluded directories in place so os.walk never descends into them.
+        dirnames[:] = [name for name in dirnames if name not in excluded]
+        files.extend(Path(dirpath, name) for name in filenames if name.endswith(".py"))
+    return sorted(files)
 
 
 def check_loc(
@@ -21,9 +33,7 @@ def check_loc(
 ) -> list[dict]:
     excluded = excluded_dirs or DEFAULT_EXCLUDED_DIRS
     violations = []
-    for file_path in collect_python_files(repo_root):
-        if any(part in excluded for part in file_path.parts):
-            continue
+    for file_path in collect_python_files(repo_root, excluded):
         loc = count_loc(file_path)
         if loc > max_loc:
             violations.append({
@@ -1,6 +1,5 @@
-import json
-
 from base import InvariantCheck, InvariantChecker, InvariantResult
+from ledger_utils import load_ledger_entries
 
 
 class PromotionInvariant(InvariantChecker):
@@ -11,25 +10,11 @@ class PromotionInvariant(InvariantChecker):
     """
 
     def get_pending_promotions(self) -> list:
-        promotions = []
-
-        ledger_path = self.repo_root / "control_plane/ledger/"
-        if not ledger_path.exists():
-            return promotions
-
-        for entry_file in ledger_path.rglob("*.json"):
-            try:
-                with open(entry_file) as f:
-                    entry = json.load(f)
-                    if entry.get("entry_type") in ["promotion", "stage_unlock"]:
-                        promotions.append({
-                            "file": str(entry_file.relative_to(self.repo_root)),
-                            "entry": entry,
-                        })
-            except (json.JSONDecodeError, IOError):
-                continue
-
-        return promotions
+        return [
+            {"file": entry["file_rel"], "entry": entry["data"]}
+            for entry in self.artifacts.load(load_ledger_entries)
+            if entry["data"].get("entry_type") in ("promotion", "stage_unlock")
+        ]
 
     def validate_promotion(self, promotion: dict) -> tuple[bool, str]:
         entry = promotion["entry"]
@@ -1,15 +1,50 @@
 from pathlib import Path
 from typing import Any
 
-from evoalign.provenance import sha256_canonical, sha256_data_file
+from evoalign.provenance import sha256_canonical
 
-from file_utils import iter_data_files, load_data_file
+from file_utils import iter_json_files, load_data_file, load_data_files, relative_str
 
 
 def compute_object_hash(obj: Any) -> str:
     return sha256_canonical(obj)
 
 
+# Stands in for ids that cannot be set members; it matches no registry or manifest id.
+_INVALID_ID = object()
+
+
+def _hashable_id(value: Any) -> Any:
+    try:
+        hash(value)
+    except TypeError:
+        return _INVALID_ID
+    return value
+
+
+def _id_set(values: Any) -> frozenset:
+    # Non-string ids are kept so membership checks still fail on them; a non-list
+    # value counts as a single invalid id.
+    if not values:
+        return frozenset()
+    if not isinstance(values, list):
+        return frozenset({_INVALID_ID})
+    return frozenset(map(_hashable_id, values))
+
+
+def sorted_seeds(values: Any) -> tuple | None:
+    # Seeds compare order-insensitively; None marks a value that cannot be sorted
+    # (not a list, or mixed types), which callers compare as the raw list instead.
+    if not values:
+        return ()
+    if not isinstance(values, list):
+        return None
+    try:
+        return tuple(sorted(values))
+    except TypeError:
+        return None
+
+
 def load_registry(repo_root: Path) -> dict | None:
     registry_path = repo_root / "control_plane/evals/suites/registry.json"
     if not registry_path.exists():
@@ -19,18 +54,16 @@ def load_registry(repo_root: Path) -> dict | None:
         return None
     return {
         "file": registry_path,
+        "file_rel": relative_str(registry_path, repo_root),
         "data": data,
-        "hash": sha256_data_file(registry_path),
+        "hash": sha256_canonical(data),
     }
 
 
 def load_suite_sets(repo_root: Path) -> dict[str, dict]:
     sets_dir = repo_root / "control_plane/evals/suites/sets"
     suite_sets = {}
-    for file_path in iter_data_files(sets_dir):
-        if file_path.suffix != ".json":
-            continue
-        data = load_data_file(file_path)
+    for file_path, data in load_data_files(iter_json_files(sets_dir)):
         if not isinstance(data, dict):
             continue
         suite_set_id = data.get("suite_set_id")
@@ -38,8 +71,10 @@ def load_suite_sets(repo_root: Path) -> dict[str, dict]:
             continue
         suite_sets[suite_set_id] = {
             "file": file_path,
+            "file_rel": relative_str(file_path, repo_root),
             "data": data,
-            "hash": sha256_data_file(file_path),
+            "hash": sha256_canonical(data),
+            "suite_ids": _id_set(data.get("suite_ids")),
         }
     return suite_sets
 
@@ -47,10 +82,7 @@ def load_suite_sets(repo_root: Path) -> dict[str, dict]:
 def load_dataset_manifests(repo_root: Path) -> dict[str, dict]:
     manifests_dir = repo_root / "control_plane/evals/datasets/manifests"
     datasets = {}
-    for file_path in iter_data_files(manifests_dir):
-        if file_path.suffix != ".json":
-            continue
-        data = load_data_file(file_path)
+    for file_path, data in load_data_files(iter_json_files(manifests_dir)):
         if not isinstance(data, dict):
             continue
         dataset_id = data.get("dataset_id")
@@ -58,8 +90,9 @@ def load_dataset_manifests(repo_root: Path) -> dict[str, dict]:
             continue
         datasets[dataset_id] = {
             "file": file_path,
+            "file_rel": relative_str(file_path, repo_root),
             "data": data,
-            "hash": sha256_data_file(file_path),
+            "hash": sha256_canonical(data),
         }
     return datasets
 
@@ -67,10 +100,7 @@ def load_dataset_manifests(repo_root: Path) -> dict[str, dict]:
 def load_eval_runs(repo_root: Path) -> dict[str, dict]:
     runs_dir = repo_root / "control_plane/evals/runs"
     runs = {}
-    for file_path in iter_data_files(runs_dir):
-        if file_path.suffix != ".json":
-            continue
-        data = load_data_file(file_path)
+    for file_path, data in load_data_files(iter_json_files(runs_dir)):
         if not isinstance(data, dict):
             continue
         run_id = data.get("eval_run_id")
@@ -78,8 +108,10 @@ def load_eval_runs(repo_root: Path) -> dict[str, dict]:
             continue
         runs[run_id] = {
             "file": file_path,
+            "file_rel": relative_str(file_path, repo_root),
             "data": data,
-            "hash": sha256_data_file(file_path),
+            "hash": sha256_canonical(data),
+            "sorted_seeds": sorted_seeds(data.get("random_seeds")),
         }
     return runs
 
@@ -87,10 +119,7 @@ def load_eval_runs(repo_root: Path) -> dict[str, dict]:
 def load_sweeps(repo_root: Path) -> dict[str, dict]:
     sweeps_dir = repo_root / "control_plane/governor/sweeps"
     sweeps = {}
-    for file_path in iter_data_files(sweeps_dir):
-        if file_path.suffix != ".json":
-            continue
-        data = load_data_file(file_path)
+    for file_path, data in load_data_files(iter_json_files(sweeps_dir)):
         if not isinstance(data, dict):
             continue
         sweep_id = data.get("sweep_id")
@@ -98,8 +127,10 @@ def load_sweeps(repo_root: Path) -> dict[str, dict]:
             continue
         sweeps[sweep_id] = {
             "file": file_path,
+            "file_rel": relative_str(file_path, repo_root),
             "data": data,
-            "hash": sha256_data_file(file_path),
+            "hash": sha256_canonical(data),
+            "eval_run_ids": _id_set(data.get("eval_run_ids")),
         }
     return sweeps
 
@@ -107,42 +138,39 @@ def load_sweeps(repo_root: Path) -> dict[str, dict]:
 def load_risk_fits(repo_root: Path) -> list[dict]:
     fits_dir = repo_root / "control_plane/governor/risk_fits"
     fits = []
-    for file_path in iter_data_files(fits_dir):
-        if file_path.suffix != ".json":
-            continue
-        data = load_data_file(file_path)
+    for file_path, data in load_data_files(iter_json_files(fits_dir)):
         if isinstance(data, list):
             items = data
         else:
             items = [data]
+        file_rel = relative_str(file_path, repo_root)
         for fit in items:
             if not isinstance(fit, dict):
                 continue
-            fits.append({"file": file_path, "data": fit})
+            fits.append({"file": file_path, "file_rel": file_rel, "data": fit, "hash": sha256_canonical(fit)})
     return fits
 
 
 def load_oversight_plan_files(repo_root: Path) -> list[dict]:
     plans_dir = repo_root / "control_plane/governor/oversight_plans"
     plans = []
-    for file_path in iter_data_files(plans_dir):
-        if file_path.suffix != ".json":
-            continue
-        data = load_data_file(file_path)
+    for file_path, data in load_data_files(iter_json_files(plans_dir)):
         if not isinstance(data, dict):
             continue
-        plans.append({"file": file_path, "data": data})
+        plans.append({"file": file_path, "file_rel": relative_str(file_path, repo_root), "data": data})
     return plans
 
 
 def load_aars(repo_root: Path) -> list[dict]:
     aars_dir = repo_root / "aars"
     aars = []
-    for file_path in iter_data_files(aars_dir):
-        if file_path.suffix != ".json":
-            continue
-        data = load_data_file(file_path)
+    for file_path, data in load_data_files(iter_json_files(aars_dir)):
         if not isinstance(data, dict):
             continue
-        aars.append({"file": file_path, "data": data})
+        aars.append({
+            "file": file_path,
+            "file_rel": relative_str(file_path, repo_root),
+            "data": data,
+            "hash": sha256_canonical(data),
+        })
     return aars
@@ -1,6 +1,5 @@
-import json
-
 from base import InvariantCheck, InvariantChecker, InvariantResult
+from file_utils import load_data_files, relative_str
 
 
 class RollbackInvariant(InvariantChecker):
@@ -10,24 +9,17 @@ class RollbackInvariant(InvariantChecker):
     """
 
     def get_deployment_configs(self) -> list:
-        configs = []
-        deploy_path = self.repo_root / "deployments/"
-
-        if not deploy_path.exists():
-            return configs
-
-        for config_file in deploy_path.rglob("*.json"):
-            try:
-                with open(config_file) as f:
-                    config = json.load(f)
-                    configs.append({
-                        "file": str(config_file.relative_to(self.repo_root)),
-                        "config": config,
-                    })
-            except (json.JSONDecodeError, IOError):
-                continue
-
-        return configs
+        # Shares the deployments/ listing and parses with SalvageInvariant through the file index.
+        files = self.artifacts.files
+        config_files = [
+            config_file
+            for config_file in files.data_files(self.repo_root / "deployments/")
+            if config_file.suffix == ".json"
+        ]
+        return [
+            {"file": relative_str(config_file, self.repo_root), "config": config}
+            for config_file, config in load_data_files(config_files, parse=files.load_data_file, skip_errors=True)
+        ]
 
     def validate_rollback(self, deployment: dict) -> tuple[bool, str]:
         config = deployment["config"]
@@ -1,8 +1,7 @@
 """Runtime Config Invariant: validates damping and monitoring configs match AAR claims."""
 
 from base import InvariantCheck, InvariantChecker, InvariantResult
-from file_utils import iter_data_files, load_data_file
-from provenance_utils import load_aars
+from file_utils import load_data_files, relative_str
 
 
 class RuntimeConfigInvariant(InvariantChecker):
@@ -10,12 +9,12 @@ class RuntimeConfigInvariant(InvariantChecker):
 
     def _load_runtime_configs(self) -> list[dict]:
         runtime_dir = self.repo_root / "control_plane/runtime"
-        configs = []
-        for file_path in iter_data_files(runtime_dir):
-            data = load_data_file(file_path)
-            if isinstance(data, dict):
-                configs.append({"file": file_path, "data": data})
-        return configs
+        files = self.artifacts.files
+        return [
+            {"file": file_path, "data": data}
+            for file_path, data in load_data_files(files.data_files(runtime_dir), parse=files.load_data_file)
+            if isinstance(data, dict)
+        ]
 
     def _check_damping_consistency(self, config: dict, aar_data: dict, failures: list, file_path: str) -> None:
         aar_policy = (aar_data.get("stability_controls") or {}).get("update_policy") or {}
@@ -65,6 +64,13 @@ class RuntimeConfigInvariant(InvariantChecker):
         # Check alerting thresholds
         aar_thresholds = aar_monitoring.get("alerting_thresholds") or []
         config_thresholds = (config.get("alerting") or {}).get("thresholds") or []
+        config_by_metric: dict = {}
+        for ct in config_thresholds:
+            if isinstance(ct, dict):
+                try:
+                    config_by_metric.setdefault(ct.get("metric"), ct)
+                except TypeError:
+                    continue
 
         for aar_thresh in aar_thresholds:
             if not isinstance(aar_thresh, dict):
@@ -74,13 +80,14 @@ class RuntimeConfigInvariant(InvariantChecker):
             if not metric or aar_value is None:
                 continue
 
-            # Find matching config threshold
-            config_match = None
-            for ct in config_thresholds:
-                if isinstance(ct, dict) and ct.get("metric") == metric:
-                    config_match = ct
-                    break
-
+            try:
+                config_match = config_by_metric.get(metric)
+            except TypeError:
+                # Unhashable metrics are not indexed; match them as the linear scan did.
+                config_match = next(
+                    (ct for ct in config_thresholds if isinstance(ct, dict) and ct.get("metric") == metric),
+                    None,
+                )
             if config_match is None:
                 failures.append({
                     "file": file_path,
@@ -101,13 +108,12 @@ class RuntimeConfigInvariant(InvariantChecker):
                 message="No runtime configs found",
             )
 
-        aars = load_aars(self.repo_root)
-        aar_index = {aar["data"].get("aar_id"): aar["data"] for aar in aars if aar["data"].get("aar_id")}
+        aar_index = self.artifacts.aar_index()
 
         failures = []
         for config in configs:
             data = config["data"]
-            file_path = str(config["file"].relative_to(self.repo_root))
+            file_path = relative_str(config["file"], self.repo_root)
             aar_ref = data.get("aar_reference")
 
             if aar_ref:
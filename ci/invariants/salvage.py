@@ -1,6 +1,17 @@
-import json
+from functools import cached_property
+from typing import Any
 
 from base import InvariantCheck, InvariantChecker, InvariantResult
+from file_utils import load_data_files, relative_str
+from ledger_utils import load_ledger_entries
+
+
+def _format_ref_path(node: Any) -> str:
+    segments = []
+    while node is not None:
+        node, segment, is_index = node
+        segments.append(f"[{segment}]" if is_index else f".{segment}")
+    return "".join(reversed(segments))
 
 
 class SalvageInvariant(InvariantChecker):
@@ -20,41 +31,48 @@ class SalvageInvariant(InvariantChecker):
             "training/pipeline/",
         ]
 
-        for path in deploy_paths:
-            full_path = self.repo_root / path
-            if not full_path.exists():
-                continue
-
-            for config_file in full_path.rglob("*.json"):
-                try:
-                    with open(config_file) as f:
-                        config = json.load(f)
-                        salvage_refs = self._find_salvage_refs(config)
-                        if salvage_refs:
-                            usages.append({
-                                "file": str(config_file.relative_to(self.repo_root)),
-                                "salvage_refs": salvage_refs,
-                            })
-                except (json.JSONDecodeError, IOError):
-                    continue
+        files = self.artifacts.files
+        config_files = [
+            config_file
+            for path in deploy_paths
+            for config_file in files.data_files(self.repo_root / path)
+            if config_file.suffix == ".json"
+        ]
+        for config_file, config in load_data_files(config_files, parse=files.load_data_file, skip_errors=True):
+            salvage_refs = self._find_salvage_refs(config)
+            if salvage_refs:
+                usages.append({
+                    "file": relative_str(config_file, self.repo_root),
+                    "salvage_refs": salvage_refs,
+                })
 
         return usages
 
-    def _find_salvage_refs(self, obj, path="") -> list:
+    def _find_salvage_refs(self, obj) -> list:
+        # Depth-first with an explicit stack; children are pushed in reverse so refs
+        # come out in document order, and scalars are never pushed. Paths are
+        # (parent, segment, is_index) links, only joined into a string for hits.
         refs = []
-
-        if isinstance(obj, dict):
-            if "salvage_artifact_id" in obj or "salvage_artifacts" in obj:
-                refs.append({
-                    "path": path,
-                    "artifact_ids": obj.get("salvage_artifact_id") or obj.get("salvage_artifacts"),
-                })
-            for k, v in obj.items():
-                refs.extend(self._find_salvage_refs(v, f"{path}.{k}"))
-        elif isinstance(obj, list):
-            for i, item in enumerate(obj):
-                refs.extend(self._find_salvage_refs(item, f"{path}[{i}]"))
-
+        stack: list[tuple[Any, Any]] = [(obj, None)]
+        while stack:
+            value, node = stack.pop()
+            if isinstance(value, dict):
+                if "salvage_artifact_id" in value or "salvage_artifacts" in value:
+                    refs.append({
+                        "path": _format_ref_path(node),
+                        "artifact_ids": value.get("salvage_artifact_id") or value.get("salvage_artifacts"),
+                    })
+                stack.extend(reversed([
+                    (child, (node, key, False))
+                    for key, child in value.items()
+                    if isinstance(child, (dict, list))
+                ]))
+            elif isinstance(value, list):
+                stack.extend(reversed([
+                    (item, (node, index, True))
+                    for index, item in enumerate(value)
+                    if isinstance(item, (dict, list))
+                ]))
         return refs
 
     def validate_salvage_usage(self, usage: dict) -> tuple[bool, str]:
@@ -72,30 +90,43 @@ class SalvageInvariant(InvariantChecker):
 
         return True, "Valid"
 
-    def _check_salvage_certified(self, artifact_id: str) -> bool:
-        ledger_path = self.repo_root / "control_plane/ledger/"
-
-        if not ledger_path.exists():
+    def _check_salvage_certified(self, artifact_id: Any) -> bool:
+        try:
+            salvage = self._ledger_index.get(artifact_id)
+        except TypeError:
+            # Unhashable ids (lists, objects) cannot name a ledger record.
             return False
+        return salvage is not None and self._is_certified(salvage)
+
+    @cached_property
+    def _ledger_index(self) -> dict[Any, dict]:
+        """First salvage record per artifact_id, built in one pass over the shared ledger.
+
+        The first ledger record for an artifact decides, as the per-artifact scan did;
+        certification is only evaluated for the ids a deployable config references.
+        """
+        records = {}
+        for entry in self.artifacts.load(load_ledger_entries):
+            for salvage in entry["data"].get("salvage_artifacts") or []:
+                if not isinstance(salvage, dict):
+                    continue
+                artifact_id = salvage.get("artifact_id")
+                try:
+                    records.setdefault(artifact_id, salvage)
+                except TypeError:
+                    continue
+        return records
 
-        for entry_file in ledger_path.rglob("*.json"):
-            try:
-                with open(entry_file) as f:
-                    entry = json.load(f)
-                    for salvage in entry.get("salvage_artifacts", []):
-                        if salvage.get("artifact_id") == artifact_id:
-                            if not salvage.get("quarantine_certified"):
-                                return False
-                            tests = salvage.get("transfer_tests_passed", [])
-                            if not tests or not all(t.get("passed") for t in tests):
-                                return False
-                            if not salvage.get("taint_tags"):
-                                return False
-                            return True
-            except (json.JSONDecodeError, IOError):
-                continue
-
-        return False
+    @staticmethod
+    def _is_certified(salvage: dict) -> bool:
+        if not salvage.get("quarantine_certified"):
+            return False
+        tests = salvage.get("transfer_tests_passed", [])
+        if not isinstance(tests, list) or not tests:
+            return False
+        if not all(isinstance(t, dict) and t.get("passed") for t in tests):
+            return False
+        return bool(salvage.get("taint_tags"))
 
     def check(self) -> InvariantCheck:
         usages = self.get_salvage_usages()
@@ -1,14 +1,19 @@
 #!/usr/bin/env python3
 import argparse
-import json
 from dataclasses import dataclass
+from functools import lru_cache, partial
 from pathlib import Path
+from typing import Any, Callable, Iterable
 
-import yaml
-from jsonschema import Draft202012Validator, ValidationError, validate
+from jsonschema import Draft202012Validator, SchemaError, ValidationError, validate
+from jsonschema.exceptions import best_match
+from jsonschema.validators import validator_for
+
+from evoalign.provenance import json_loads
 
 from base import InvariantCheck, InvariantChecker, InvariantResult
-from file_utils import iter_data_files
+from file_index import RepoFileIndex
+from file_utils import iter_data_files, load_yaml, map_files, relative_str
 
 
 @dataclass(frozen=True)
@@ -94,30 +99,50 @@ SCHEMA_TARGETS = [
 
 
 def load_schema(schema_path: Path) -> dict:
-    with schema_path.open() as f:
-        return json.load(f)
+    return json_loads(schema_path.read_bytes())
+
+
+def compile_validator(schema: dict) -> Callable[[Any], None]:
+    """Equivalent of partial(jsonschema.validate, schema=schema) that checks the schema and
+    builds the validator once, instead of on every instance."""
+    cls = validator_for(schema)
+    try:
+        cls.check_schema(schema)
+    except SchemaError:
+        # Keep reporting the schema error against each file, as validate() does.
+        return partial(validate, schema=schema)
+    validator = cls(schema)
+
+    def validate_instance(instance: Any) -> None:
+        error = best_match(validator.iter_errors(instance))
+        if error is not None:
+            raise error
+
+    return validate_instance
 
 
 def load_data_file(file_path: Path, allow_yaml: bool):
     if file_path.suffix == ".json":
-        with file_path.open() as f:
-            return json.load(f)
+        return json_loads(file_path.read_bytes())
     if file_path.suffix in {".yaml", ".yml"}:
         if not allow_yaml:
             raise ValueError("YAML not allowed for this schema target")
-        with file_path.open() as f:
-            return yaml.safe_load(f)
+        return load_yaml(file_path)
     raise ValueError(f"Unsupported data file suffix: {file_path.suffix}")
 
 
-def iter_target_files(repo_root: Path, target: SchemaTarget) -> list[Path]:
+def iter_target_files(
+    repo_root: Path,
+    target: SchemaTarget,
+    list_files: Callable[[Path], Iterable[Path]] = iter_data_files,
+) -> list[Path]:
     data_path = repo_root / target.path
     if not data_path.exists():
         return []
     if target.single_file or data_path.is_file():
         return [data_path]
     files = []
-    for file_path in iter_data_files(data_path):
+    for file_path in list_files(data_path):
         if file_path.suffix in {".yaml", ".yml"} and not target.allow_yaml:
             continue
         if target.match_prefix and not file_path.name.startswith(target.match_prefix):
@@ -126,6 +151,16 @@ def iter_target_files(repo_root: Path, target: SchemaTarget) -> list[Path]:
     return sorted(files)
 
 
+@lru_cache(maxsize=None)
+def _check_schema_file(path: str, mtime_ns: int, size: int) -> str | None:
+    # Keyed like HashCache, so an edited schema is re-checked and an unchanged one is not.
+    try:
+        Draft202012Validator.check_schema(load_schema(Path(path)))
+    except Exception as exc:
+        return str(exc)
+    return None
+
+
 def validate_schema_files(repo_root: Path) -> list[dict]:
     schemas_dir = repo_root / "schemas"
     if not schemas_dir.exists():
@@ -137,20 +172,28 @@ def validate_schema_files(repo_root: Path) -> list[dict]:
     errors = []
     for schema_file in sorted(schemas_dir.glob("*.schema.json")):
         try:
-            schema = load_schema(schema_file)
-            Draft202012Validator.check_schema(schema)
-        except Exception as exc:
+            stat = schema_file.stat()
+            reason = _check_schema_file(str(schema_file), stat.st_mtime_ns, stat.st_size)
+        except OSError as exc:
+            reason = str(exc)
+        if reason is not None:
             errors.append({
-                "file": str(schema_file.relative_to(repo_root)),
-                "reason": str(exc),
+                "file": relative_str(schema_file, repo_root),
+                "reason": reason,
             })
     return errors
 
 
-def validate_data_files(repo_root: Path) -> tuple[int, list[dict]]:
-    errors = []
-    validated = 0
-
+def validate_data_files(
+    repo_root: Path,
+    list_files: Callable[[Path], Iterable[Path]] | None = None,
+) -> tuple[int, list[dict]]:
+    # Targets that share a directory (the runtime damping/monitoring configs) share one listing.
+    list_files = list_files or RepoFileIndex().data_files
+    # Missing-schema errors keep the number of jobs queued before them, so they can be
+    # reported in target order alongside the per-file errors.
+    missing_schemas: list[tuple[int, dict]] = []
+    jobs: list[tuple[Callable[[Any], None], Path, bool]] = []
     for target in SCHEMA_TARGETS:
         data_path = repo_root / target.path
         if not data_path.exists():
@@ -158,29 +201,35 @@ def validate_data_files(repo_root: Path) -> tuple[int, list[dict]]:
 
         schema_path = repo_root / "schemas" / target.schema
         if not schema_path.exists():
-            errors.append({
-                "file": str(data_path.relative_to(repo_root)),
+            missing_schemas.append((len(jobs), {
+                "file": relative_str(data_path, repo_root),
                 "reason": f"schema missing: {target.schema}",
-            })
+            }))
             continue
 
-        schema = load_schema(schema_path)
-        for file_path in iter_target_files(repo_root, target):
-            try:
-                data = load_data_file(file_path, target.allow_yaml)
-                validate(instance=data, schema=schema)
-                validated += 1
-            except ValidationError as exc:
-                errors.append({
-                    "file": str(file_path.relative_to(repo_root)),
-                    "reason": exc.message,
-                })
-            except Exception as exc:
-                errors.append({
-                    "file": str(file_path.relative_to(repo_root)),
-                    "reason": str(exc),
-                })
+        validate_instance = compile_validator(load_schema(schema_path))
+        jobs.extend(
+            (validate_instance, file_path, target.allow_yaml)
+            for file_path in iter_target_files(repo_root, target, list_files)
+        )
 
+    def check_file(job: tuple) -> dict | None:
+        validate_instance, file_path, allow_yaml = job
+        try:
+            validate_instance(load_data_file(file_path, allow_yaml))
+        except ValidationError as exc:
+            return {"file": relative_str(file_path, repo_root), "reason": exc.message}
+        except Exception as exc:
+            return {"file": relative_str(file_path, repo_root), "reason": str(exc)}
+        return None
+
+    results = map_files(check_file, jobs)
+    validated = sum(1 for result in results if result is None)
+    # A missing-schema error sorts before the job queued at the same position.
+    positioned = [(position, 0, error) for position, error in missing_schemas]
+    positioned.extend((index, 1, result) for index, result in enumerate(results) if result is not None)
+    positioned.sort(key=lambda item: item[:2])
+    errors = [error for _, _, error in positioned]
     return validated, errors
 
 
@@ -189,7 +238,7 @@ class SchemaValidationInvariant(InvariantChecker):
 
     def check(self) -> InvariantCheck:
         schema_errors = validate_schema_files(self.repo_root)
-        validated, data_errors = validate_data_files(self.repo_root)
+        validated, data_errors = validate_data_files(self.repo_root, self.artifacts.files.data_files)
 
         failures = schema_errors + data_errors
         if failures:
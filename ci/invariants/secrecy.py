@@ -6,7 +6,7 @@ class SecrecyInvariant(InvariantChecker):
     """Enforces: secret suite fingerprints do not appear in protected artifacts."""
 
     def check(self) -> InvariantCheck:
-        audit = build_secrecy_audit(self.repo_root)
+        audit = build_secrecy_audit(self.repo_root, hash_cache=self.hash_cache, artifacts=self.artifacts)
         status = audit.get("status")
 
         if status == "skip":
@@ -1,10 +1,16 @@
 import hashlib
 from pathlib import Path
-from typing import Iterable
+from typing import Any, Callable, Iterable
 
-from evoalign.provenance import sha256_data_file, verify_hash
-from evoalign.secrecy_fingerprints import SecrecyFingerprintError, load_hash_registry, scan_protected_paths
+from evoalign.provenance import HashCache, verify_hash
+from evoalign.secrecy_fingerprints import (
+    HashingScheme,
+    SecrecyFingerprintError,
+    load_hash_registry,
+    scan_protected_paths,
+)
 
+from artifact_index import ArtifactIndex
 from file_utils import load_data_file
 
 
@@ -12,14 +18,32 @@ SUITE_REGISTRY_PATH = Path("control_plane/evals/suites/registry.json")
 SECRET_HASH_REGISTRY_PATH = Path("control_plane/evals/suites/hash_registries/secret_suite_hashes_v1.json")
 
 
-def load_suite_registry(repo_root: Path) -> tuple[dict, str]:
+def _read_suite_registry(repo_root: Path) -> dict:
     registry_path = repo_root / SUITE_REGISTRY_PATH
     if not registry_path.exists():
         raise SecrecyFingerprintError("Suite registry not found")
     data = load_data_file(registry_path)
     if not isinstance(data, dict):
         raise SecrecyFingerprintError("Suite registry must be an object")
-    return data, sha256_data_file(registry_path)
+    return data
+
+
+def _read_secret_hash_registry(repo_root: Path) -> tuple[dict, HashingScheme]:
+    return load_hash_registry(repo_root / SECRET_HASH_REGISTRY_PATH)
+
+
+def _load(loader: Callable[[Path], Any], repo_root: Path, artifacts: ArtifactIndex | None) -> Any:
+    # With a run's ArtifactIndex, the secrecy invariants share one parse of each registry.
+    return artifacts.load(loader) if artifacts is not None else loader(repo_root)
+
+
+def load_suite_registry(
+    repo_root: Path,
+    hash_cache: HashCache | None = None,
+    artifacts: ArtifactIndex | None = None,
+) -> tuple[dict, str]:
+    data = _load(_read_suite_registry, repo_root, artifacts)
+    return data, (hash_cache or HashCache()).sha256_parsed(repo_root / SUITE_REGISTRY_PATH, data)
 
 
 def get_secret_suites(registry: dict) -> dict[str, dict]:
@@ -32,10 +56,13 @@ def get_secret_suites(registry: dict) -> dict[str, dict]:
     return secret
 
 
-def load_secret_hash_registry(repo_root: Path) -> tuple[dict, object, str]:
-    registry_path = repo_root / SECRET_HASH_REGISTRY_PATH
-    data, scheme = load_hash_registry(registry_path)
-    registry_hash = sha256_data_file(registry_path)
+def load_secret_hash_registry(
+    repo_root: Path,
+    hash_cache: HashCache | None = None,
+    artifacts: ArtifactIndex | None = None,
+) -> tuple[dict, object, str]:
+    data, scheme = _load(_read_secret_hash_registry, repo_root, artifacts)
+    registry_hash = (hash_cache or HashCache()).sha256_parsed(repo_root / SECRET_HASH_REGISTRY_PATH, data)
     return data, scheme, registry_hash
 
 
@@ -62,9 +89,11 @@ def build_secret_fingerprint_index(secret_registry: dict) -> tuple[set[str], dic
 def build_secrecy_audit(
     repo_root: Path,
     protected_paths: Iterable[str] | None = None,
+    hash_cache: HashCache | None = None,
+    artifacts: ArtifactIndex | None = None,
 ) -> dict:
     try:
-        registry, registry_hash = load_suite_registry(repo_root)
+        registry, registry_hash = load_suite_registry(repo_root, hash_cache, artifacts)
     except SecrecyFingerprintError as exc:
         return {
             "status": "fail",
@@ -83,7 +112,7 @@ def build_secrecy_audit(
         }
 
     try:
-        secret_registry, scheme, secret_registry_hash = load_secret_hash_registry(repo_root)
+        secret_registry, scheme, secret_registry_hash = load_secret_hash_registry(repo_root, hash_cache, artifacts)
     except SecrecyFingerprintError as exc:
         return {
             "status": "fail",
@@ -114,13 +143,16 @@ def build_secrecy_audit(
 
     errors.extend(scan_result.errors)
 
-    leaks = []
-    for fingerprint in sorted(secret_fingerprints & scan_result.fingerprints):
-        leaks.append({
+    # The intersection iterates the smaller set and is usually empty; every leaked
+    # fingerprint was scanned, so it always has sources.
+    leaks = [
+        {
             "fingerprint": fingerprint,
-            "suite_ids": sorted(fingerprint_index.get(fingerprint, [])),
-            "files": sorted(scan_result.fingerprint_sources.get(fingerprint, [])),
-        })
+            "suite_ids": sorted(fingerprint_index.get(fingerprint, ())),
+            "files": sorted(scan_result.fingerprint_sources[fingerprint]),
+        }
+        for fingerprint in sorted(secret_fingerprints & scan_result.fingerprints)
+    ]
 
     status = "pass"
     message = "Secrecy hash check passed"
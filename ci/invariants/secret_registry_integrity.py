@@ -16,7 +16,7 @@ class SecretRegistryIntegrityInvariant(InvariantChecker):
 
     def check(self) -> InvariantCheck:
         try:
-            suite_registry, suite_registry_hash = load_suite_registry(self.repo_root)
+            suite_registry, suite_registry_hash = load_suite_registry(self.repo_root, self.hash_cache, self.artifacts)
         except SecrecyFingerprintError as exc:
             return InvariantCheck(
                 name="SECRET_REGISTRY_INTEGRITY",
@@ -33,7 +33,7 @@ class SecretRegistryIntegrityInvariant(InvariantChecker):
             )
 
         try:
-            secret_registry, scheme, _ = load_secret_hash_registry(self.repo_root)
+            secret_registry, scheme, _ = load_secret_hash_registry(self.repo_root, self.hash_cache, self.artifacts)
         except SecrecyFingerprintError as exc:
             return InvariantCheck(
                 name="SECRET_REGISTRY_INTEGRITY",
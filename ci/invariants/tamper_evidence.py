@@ -6,6 +6,7 @@ from base import InvariantCheck, InvariantChecker, InvariantResult
 from evoalign.merkle import compute_artifact_merkle_root, merkle_root
 from evoalign.provenance import sha256_canonical, sha256_data_file, verify_hash
 from file_utils import iter_data_files, load_data_file
+from ledger_utils import load_lineage_entries
 from provenance_utils import load_aars
 
 
@@ -21,21 +22,15 @@ def load_key_registry(repo_root: Path) -> dict | None:
 
 def load_lineage_entry_hashes(repo_root: Path) -> list[str]:
     """Load all lineage entry hashes for merkle root computation."""
-    lineage_dir = repo_root / "lineage"
-    hashes = []
-    for file_path in iter_data_files(lineage_dir):
-        data = load_data_file(file_path)
-        if isinstance(data, dict):
-            hashes.append(sha256_canonical(data))
-    return sorted(hashes)
+    return sorted(sha256_canonical(entry["data"]) for entry in load_lineage_entries(repo_root))
 
 
 class TamperEvidenceInvariant(InvariantChecker):
     """Enforces: merkle roots and signatures are verifiable when present."""
 
     def check(self) -> InvariantCheck:
-        aars = load_aars(self.repo_root)
-        key_registry = load_key_registry(self.repo_root)
+        aars = self.artifacts.load(load_aars)
+        key_registry = self.artifacts.load(load_key_registry)
 
         if not aars and not key_registry:
             return InvariantCheck(
@@ -53,12 +48,16 @@ class TamperEvidenceInvariant(InvariantChecker):
                     if key_id:
                         key_ids.add(key_id)
 
-        lineage_hashes = load_lineage_entry_hashes(self.repo_root)
+        # Same entries and digest cache as LINEAGE_INTEGRITY, so each entry is parsed and hashed once.
+        lineage_hashes = sorted(
+            self.hash_cache.sha256_parsed(entry["file"], entry["data"])
+            for entry in self.artifacts.load(load_lineage_entries)
+        )
         computed_ledger_root = merkle_root(lineage_hashes) if lineage_hashes else ""
 
         for aar in aars:
             data = aar["data"]
-            file_path = str(aar["file"].relative_to(self.repo_root))
+            file_path = aar["file_rel"]
 
             # Check provenance.merkle_root if present
             provenance = data.get("provenance") or {}
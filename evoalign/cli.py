@@ -5,7 +5,7 @@ import sys
 from datetime import datetime, timezone
 from pathlib import Path
 
-from evoalign.provenance import SUPPORTED_DATA_SUFFIXES, sha256_data_file, sha256_file
+from evoalign.provenance import SUPPORTED_DATA_SUFFIXES, HashCache, json_loads, sha256_data_file, sha256_file
 
 
 EVIDENCE_INVARIANTS = [
@@ -27,8 +27,7 @@ def compute_file_hash(file_path: Path) -> str:
 def load_template(template_path: Path | None, repo_root: Path) -> dict:
     candidate = template_path or (repo_root / "aars" / "aar_v0_1.json")
     if candidate.exists():
-        with candidate.open() as f:
-            data = json.load(f)
+        data = json_loads(candidate.read_bytes())
         if isinstance(data, dict):
             return data
         raise ValueError("Template must be a JSON object")
@@ -91,11 +90,17 @@ def load_invariant_classes(invariants_root: Path | None = None) -> tuple[list[ty
 def run_evidence_chain(repo_root: Path, invariants_root: Path | None = None) -> tuple[list, bool]:
     invariants_root = invariants_root or (repo_root / "ci" / "invariants")
     invariant_classes, invariant_result = load_invariant_classes(invariants_root)
+    from artifact_index import ArtifactIndex  # noqa: E402
+
+    # One digest cache and artifact index for the whole chain, as check_invariants does,
+    # so files the invariants have in common are parsed and hashed once.
+    hash_cache = HashCache()
+    artifacts = ArtifactIndex(repo_root)
     results = []
     all_passed = True
 
     for invariant_class in invariant_classes:
-        checker = invariant_class(repo_root)
+        checker = invariant_class(repo_root, hash_cache=hash_cache, artifacts=artifacts)
         result = checker.check()
         results.append(result)
         if result.result == invariant_result.FAIL:
@@ -1,14 +1,14 @@
 from __future__ import annotations
 
 import hashlib
-import json
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, Iterable, Mapping
 
-import yaml
 from jsonschema import validate
 
+from evoalign.provenance import json_loads, yaml_loads
+
 
 class ContextLatticeError(ValueError):
     pass
@@ -175,17 +175,16 @@ class ContextLattice:
         self.version = version
         self.dimensions = dimensions
         self.contexts = contexts
+        self._leq_cache: Dict[tuple[str, str], bool] = {}
 
     @classmethod
     def load(cls, lattice_path: Path, schema_path: Path | None = None) -> "ContextLattice":
         if not lattice_path.exists():
             raise ContextLatticeError(f"Lattice file not found: {lattice_path}")
-        with lattice_path.open() as f:
-            data = yaml.safe_load(f)
+        data = yaml_loads(lattice_path.read_bytes())
         if schema_path:
             try:
-                with schema_path.open() as f:
-                    schema = json.load(f)
+                schema = json_loads(schema_path.read_bytes())
             except OSError as exc:
                 raise ContextLatticeError(f"Schema file not found: {schema_path}") from exc
             try:
@@ -262,12 +261,18 @@ class ContextLattice:
             raise ContextLatticeError(f"Unknown context id '{context_id}'") from exc
 
     def leq(self, left_id: str, right_id: str) -> bool:
+        key = (left_id, right_id)
+        cached = self._leq_cache.get(key)
+        if cached is not None:
+            return cached
         left = self.resolve(left_id)
         right = self.resolve(right_id)
-        for dim_id, dim in self.dimensions.items():
-            if not dim.leq(left.values[dim_id], right.values[dim_id]):
-                return False
-        return True
+        result = all(
+            dim.leq(left.values[dim_id], right.values[dim_id])
+            for dim_id, dim in self.dimensions.items()
+        )
+        self._leq_cache[key] = result
+        return result
 
     def covers(self, sup_id: str, sub_id: str) -> bool:
         return self.leq(sub_id, sup_id)
@@ -294,8 +299,5 @@ class ContextLattice:
 
 
 def sha256_file(path: Path) -> str:
-    digest = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            digest.update(chunk)
-    return digest.hexdigest()
+    with path.open("rb", buffering=0) as f:
+        return hashlib.file_digest(f, "sha256").hexdigest()
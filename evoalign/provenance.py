@@ -1,18 +1,51 @@
 import hashlib
+import importlib
 import json
+import os
 import subprocess
+import threading
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable, Iterable
 
 import yaml
 
 
 SUPPORTED_DATA_SUFFIXES = {".json", ".yaml", ".yml"}
+# libyaml's C loader parses the same safe subset several times faster when available.
+YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+_CANONICAL_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+
+
+def _optional_module(name: str):
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+# orjson parses several times faster than json when installed; it is not a dependency.
+_ORJSON = _optional_module("orjson")
+
+
+def json_loads(data: bytes) -> Any:
+    if _ORJSON is not None:
+        try:
+            return _ORJSON.loads(data)
+        except _ORJSON.JSONDecodeError:
+            # json also accepts NaN/Infinity, big integers and non-UTF-8 encodings; let it decide.
+            pass
+    return json.loads(data)
+
+
+def yaml_loads(data: bytes) -> Any:
+    # Always the YAML loader: a json fast path changes results on edge cases (raw NEL,
+    # tabs, 1024+ character keys) and these results feed the integrity digests.
+    return yaml.load(data, Loader=YAML_LOADER)
 
 
 def canonical_bytes(obj: Any) -> bytes:
     try:
-        payload = json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+        payload = _CANONICAL_ENCODER.encode(obj)
     except (TypeError, ValueError) as exc:
         raise ValueError("Object is not JSON-serializable") from exc
     return payload.encode("utf-8")
@@ -23,21 +56,29 @@ def sha256_canonical(obj: Any) -> str:
     return f"sha256:{digest}"
 
 
+# file_digest allocates a 256 KiB buffer per call; below this size one read is cheaper.
+_SMALL_FILE_BYTES = 1 << 16
+
+
+def _file_digest(f, size: int, new_digest: Callable[[], Any]) -> Any:
+    if size < _SMALL_FILE_BYTES:
+        digest = new_digest()
+        digest.update(f.read())
+        return digest
+    return hashlib.file_digest(f, new_digest)
+
+
 def sha256_file(path: Path) -> str:
-    digest = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(8192), b""):
-            digest.update(chunk)
+    with path.open("rb", buffering=0) as f:
+        digest = _file_digest(f, os.fstat(f.fileno()).st_size, hashlib.sha256)
     return f"sha256:{digest.hexdigest()}"
 
 
 def load_data_file(path: Path) -> Any:
     if path.suffix == ".json":
-        with path.open() as f:
-            return json.load(f)
+        return json_loads(path.read_bytes())
     if path.suffix in {".yaml", ".yml"}:
-        with path.open() as f:
-            return yaml.safe_load(f)
+        return yaml_loads(path.read_bytes())
     raise ValueError(f"Unsupported data file suffix: {path.suffix}")
 
 
@@ -45,6 +86,104 @@ def sha256_data_file(path: Path) -> str:
     return sha256_canonical(load_data_file(path))
 
 
+def iter_files(base_path: Path, suffixes: Iterable[str]) -> list[Path]:
+    """Sorted files under base_path whose suffix is in suffixes."""
+    if not base_path.is_dir():
+        return []
+    # scandir reuses the d_type from readdir, so most entries need no extra stat().
+    # Like rglob, it does not descend into symlinked directories.
+    files = []
+    stack = [str(base_path)]
+    while stack:
+        try:
+            with os.scandir(stack.pop()) as entries:
+                for entry in entries:
+                    if entry.is_dir(follow_symlinks=False):
+                        stack.append(entry.path)
+                    elif os.path.splitext(entry.name)[1] in suffixes and entry.is_file():
+                        files.append(Path(entry.path))
+        except PermissionError:
+            continue
+    return sorted(files)
+
+
+def relative_str(file_path: Path, repo_root: Path) -> str:
+    """str(file_path.relative_to(repo_root)), by slicing the string when the prefix matches."""
+    root = str(repo_root)
+    path = str(file_path)
+    if path.startswith(root) and path[len(root):len(root) + 1] == os.sep:
+        return path[len(root) + 1:]
+    return str(file_path.relative_to(repo_root))
+
+
+class HashCache:
+    """Memoizes data-file digests for one run, keyed by (path, st_mtime_ns, st_size).
+
+    With a persist_path, digests are also kept across runs keyed by the SHA-256 of the
+    file's bytes and its suffix, so unchanged files are not re-parsed. The cache file
+    is trusted input: keep it outside the repository under check.
+
+    Safe to share between threads. Digests are computed outside the lock, so threads
+    that miss the same file together may both compute it; the results are equal.
+    """
+
+    def __init__(self, persist_path: Path | None = None) -> None:
+        self._digests: dict[tuple[str, int, int], str] = {}
+        self._persist_path = persist_path
+        self._file_digests: dict[str, str] = {}
+        self._dirty = False
+        self._lock = threading.Lock()
+        if persist_path is not None and persist_path.exists():
+            try:
+                loaded = json.loads(persist_path.read_bytes())
+            except ValueError:
+                loaded = None
+            if isinstance(loaded, dict):
+                # Entries from the earlier git blob (SHA-1) keys are dropped, not trusted.
+                self._file_digests = {
+                    key: digest for key, digest in loaded.items() if key.startswith("sha256:")
+                }
+
+    def sha256_data_file(self, path: Path) -> str:
+        return self._digest(path, lambda: sha256_data_file(path))
+
+    def sha256_parsed(self, path: Path, data: Any) -> str:
+        """Digest of a data file the caller has already parsed; equal to sha256_data_file(path)."""
+        return self._digest(path, lambda: sha256_canonical(data))
+
+    def _digest(self, path: Path, compute: Callable[[], str]) -> str:
+        stat = path.stat()
+        key = (str(path), stat.st_mtime_ns, stat.st_size)
+        digest = self._digests.get(key)
+        if digest is None:
+            digest = self._persisted_digest(path, compute) if self._persist_path is not None else compute()
+            with self._lock:
+                self._digests[key] = digest
+        return digest
+
+    def _persisted_digest(self, path: Path, compute: Callable[[], str]) -> str:
+        # Keyed by a digest as strong as the one returned, so a key collision is no
+        # easier to find than a collision in the canonical digest itself.
+        file_key = f"{sha256_file(path)}{path.suffix}"
+        digest = self._file_digests.get(file_key)
+        if digest is None:
+            digest = compute()
+            with self._lock:
+                self._file_digests[file_key] = digest
+                self._dirty = True
+        return digest
+
+    def save(self) -> None:
+        if self._persist_path is None or not self._dirty:
+            return
+        with self._lock:
+            payload = json.dumps(self._file_digests, sort_keys=True)
+            self._dirty = False
+        tmp_path = self._persist_path.with_name(f"{self._persist_path.name}.tmp")
+        tmp_path.write_text(payload)
+        os.replace(tmp_path, self._persist_path)
+
+
 def normalize_hash(value: str | None) -> str:
     if not value:
         return ""
@@ -54,7 +193,8 @@ def normalize_hash(value: str | None) -> str:
 def verify_hash(expected: str | None, actual: str | None) -> bool:
     if not expected or not actual:
         return False
-    return normalize_hash(expected) == normalize_hash(actual)
+    # Both sides usually carry the same "sha256:" prefix; skip the normalizing copies then.
+    return expected == actual or normalize_hash(expected) == normalize_hash(actual)
 
 
 def git_commit_exists(commit: str | None, repo_root: Path | None = None) -> bool:
@@ -72,3 +212,37 @@ def git_commit_exists(commit: str | None, repo_root: Path | None = None) -> bool
     except (OSError, ValueError):
         return False
     return result.returncode == 0
+
+
+def existing_git_commits(commits: Iterable[str | None], repo_root: Path | None = None) -> set[str]:
+    """Return the subset of commits that name objects in the repository.
+
+    Equivalent to git_commit_exists per commit, but answered by a single
+    `git cat-file --batch-check` process instead of one process per commit.
+    """
+    # One name per line: values that are empty, non-strings or span lines cannot resolve.
+    names = sorted({c for c in commits if c and isinstance(c, str) and "\n" not in c and "\r" not in c})
+    if not names:
+        return set()
+    root = repo_root or Path.cwd()
+    try:
+        result = subprocess.run(
+            ["git", "cat-file", "--batch-check"],
+            cwd=str(root),
+            input="".join(f"{name}\n" for name in names),
+            capture_output=True,
+            text=True,
+            check=False,
+        )
+    except (OSError, ValueError):
+        return set()
+    if result.returncode != 0:
+        return set()
+    # Output has one line per input: "<oid> <type> <size>", or "<name> missing|ambiguous".
+    lines = result.stdout.splitlines()
+    return {
+        name
+        for name, line in zip(names, lines)
+        if not line.endswith((" missing", " ambiguous"))
+    }
+
@@ -7,7 +7,7 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Iterable
 
-import yaml
+from evoalign.provenance import iter_files, json_loads, relative_str, yaml_loads
 
 
 class SecrecyFingerprintError(Exception):
@@ -58,11 +58,13 @@ DEFAULT_PROTECTED_PATHS = [
 
 SUPPORTED_SUFFIXES = {".json", ".yaml", ".yml", ".jsonl", ".txt", ".md"}
 LIST_KEYS = ("items", "examples", "prompts", "test_cases", "records")
+_ITEM_ENCODER = json.JSONEncoder(sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+_PARAGRAPH_BREAK = re.compile(r"\n\s*\n")
 
 
 def canonicalize_item(obj: Any) -> bytes:
     try:
-        payload = json.dumps(obj, sort_keys=True, separators=(",", ":"), ensure_ascii=False)
+        payload = _ITEM_ENCODER.encode(obj)
     except (TypeError, ValueError) as exc:
         raise SecrecyFingerprintError("Item is not JSON-serializable") from exc
     return payload.encode("utf-8")
@@ -111,8 +113,7 @@ def fingerprint_text_block(text: str, scheme: HashingScheme, hmac_key: bytes | N
 def load_hash_registry(path: Path) -> tuple[dict, HashingScheme]:
     if not path.exists():
         raise SecrecyFingerprintError(f"Secret hash registry not found: {path}")
-    with path.open() as f:
-        data = json.load(f)
+    data = json_loads(path.read_bytes())
     if not isinstance(data, dict):
         raise SecrecyFingerprintError("Secret hash registry must be an object")
     for field in ("registry_version", "hashing_scheme", "generated_at", "suite_registry_hash", "suites"):
@@ -158,7 +159,7 @@ def _scan_json_lines(text: str, scheme: HashingScheme, hmac_key: bytes | None) -
 
 def _scan_text_blocks(text: str, scheme: HashingScheme, hmac_key: bytes | None) -> list[str]:
     normalized = text.replace("\r\n", "\n").replace("\r", "\n")
-    paragraphs = [p.strip() for p in re.split(r"\n\s*\n", normalized) if p.strip()]
+    paragraphs = [p.strip() for p in _PARAGRAPH_BREAK.split(normalized) if p.strip()]
     fingerprints: list[str] = []
     for paragraph in paragraphs:
         fingerprint = fingerprint_text_block(paragraph, scheme, hmac_key)
@@ -184,8 +185,8 @@ def scan_file(file_path: Path, scheme: HashingScheme, hmac_key: bytes | None = N
             text = file_path.read_text(errors="ignore")
             return _scan_json_lines(text, scheme, hmac_key), errors
         if file_path.suffix in {".json", ".yaml", ".yml"}:
-            with file_path.open() as f:
-                data = json.load(f) if file_path.suffix == ".json" else yaml.safe_load(f)
+            raw = file_path.read_bytes()
+            data = json_loads(raw) if file_path.suffix == ".json" else yaml_loads(raw)
             return _scan_structured_data(data, scheme, hmac_key), errors
         if file_path.suffix in {".txt", ".md"}:
             text = file_path.read_text(errors="ignore")
@@ -209,15 +210,8 @@ def scan_protected_paths(
 
     paths = list(protected_paths) if protected_paths is not None else DEFAULT_PROTECTED_PATHS
     for rel_path in paths:
-        base_path = repo_root / rel_path
-        if not base_path.exists():
-            continue
-        for file_path in base_path.rglob("*"):
-            if not file_path.is_file():
-                continue
-            if file_path.suffix not in SUPPORTED_SUFFIXES:
-                continue
-            rel_file = str(file_path.relative_to(repo_root))
+        for file_path in iter_files(repo_root / rel_path, SUPPORTED_SUFFIXES):
+            rel_file = relative_str(file_path, repo_root)
             scanned_files.append(rel_file)
             file_fingerprints, file_errors = scan_file(file_path, scheme, hmac_key)
             errors.extend(file_errors)
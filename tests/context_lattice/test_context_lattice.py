@@ -34,6 +34,18 @@ class TestContextLatticeCoverage(unittest.TestCase):
     def test_covers_web_email_limited(self):
         self.assertTrue(self.lattice.covers("tool_access:web+email", "tool_access:limited"))
 
+    def test_covers_is_memoized(self):
+        self.assertTrue(self.lattice.covers("any", "no_tools"))
+        self.assertFalse(self.lattice.covers("no_tools", "any"))
+        self.lattice.dimensions = {}
+        self.assertTrue(self.lattice.covers("any", "no_tools"))
+        self.assertFalse(self.lattice.covers("no_tools", "any"))
+
+    def test_covers_unknown_context_always_raises(self):
+        for _ in range(2):
+            with self.assertRaises(ContextLatticeError):
+                self.lattice.covers("missing", "no_tools")
+
     def test_no_tools_not_cover_limited(self):
         self.assertFalse(self.lattice.covers("no_tools", "tool_access:limited"))
 
@@ -67,6 +67,18 @@ class TestAarEvidenceChainInvariant(unittest.TestCase):
         result = AarEvidenceChainInvariant(self.test_dir).check()
         self.assertEqual(result.result, InvariantResult.PASS)
 
+    def test_pass_with_unprefixed_hashes(self):
+        contract_hash = self._write_contract()
+        aar_one = {"aar_id": "a1", "safety_contract": {"contract_hash": contract_hash.replace("sha256:", "")}}
+        self._write_aar("aar_one.json", aar_one)
+        self._write_aar("aar_two.json", {
+            "aar_id": "a2",
+            "provenance": {"previous_aar_hash": sha256_canonical(aar_one).replace("sha256:", "")},
+        })
+
+        result = AarEvidenceChainInvariant(self.test_dir).check()
+        self.assertEqual(result.result, InvariantResult.PASS)
+
     def test_fail_contract_missing(self):
         self._write_aar("aar.json", {
             "aar_id": "a1",
@@ -4,6 +4,7 @@ import shutil
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "ci" / "invariants"))
@@ -311,6 +312,27 @@ class TestBudgetSolvencyInvariant(ContextInvariantBase):
         result = BudgetSolvencyInvariant(self.test_dir).check()
         self.assertEqual(result.result, InvariantResult.PASS)
 
+    def test_budget_solvency_negative_infinite_risk_is_computed(self):
+        self._write_safety_contract([
+            {"hazard_id": "H1", "severity_id": "S3", "context_class": "any", "tau": 0.1}
+        ])
+        self._write_risk_fits([
+            {
+                "fit_id": "fit_any",
+                "hazard_id": "H1",
+                "severity_id": "S3",
+                "context_class": "any",
+                "conservative_epsilon_high": 0.05,
+            }
+        ])
+        self._write_oversight_plans([
+            {"context_class": "tool_access:web+email", "plan_id": "plan-3", "channel_allocations": {}}
+        ])
+
+        with mock.patch("budget_solvency.compute_fit_risk", return_value=float("-inf")):
+            result = BudgetSolvencyInvariant(self.test_dir).check()
+        self.assertEqual(result.result, InvariantResult.PASS)
+
     def test_budget_solvency_fails_without_lattice(self):
         shutil.rmtree(self.test_dir / "contracts/context_lattice")
         result = BudgetSolvencyInvariant(self.test_dir).check()
@@ -509,6 +531,49 @@ class TestBudgetSolvencyInvariant(ContextInvariantBase):
         result = BudgetSolvencyInvariant(self.test_dir).check()
         self.assertEqual(result.result, InvariantResult.FAIL)
 
+    def test_budget_solvency_reports_later_fit_errors_unless_fail_fast(self):
+        self._write_safety_contract([{
+            "hazard_id": "H1",
+            "severity_id": "S3",
+            "context_class": "any",
+            "tau": 0.1,
+        }])
+        self._write_risk_fits([
+            {
+                "fit_id": "fit_over",
+                "hazard_id": "H1",
+                "severity_id": "S3",
+                "context_class": "any",
+                "conservative_epsilon_high": 0.5,
+            },
+            {
+                "fit_id": "fit_bad",
+                "hazard_id": "H1",
+                "severity_id": "S3",
+                "context_class": "any",
+                "conservative_epsilon_high": "bad",
+            },
+        ])
+        self._write_oversight_plans([{
+            "context_class": "any",
+            "plan_id": "plan-over",
+            "channel_allocations": {},
+        }])
+
+        result = BudgetSolvencyInvariant(self.test_dir).check()
+        reasons = [failure["reason"] for failure in result.details["failures"]]
+        self.assertEqual(len(reasons), 2)
+        self.assertTrue(any("Invalid numeric" in reason for reason in reasons))
+        self.assertIn("Risk 0.5 exceeds tau 0.1", reasons)
+        self.assertFalse(any("fit_file" in failure for failure in result.details["failures"]))
+
+        result = BudgetSolvencyInvariant(self.test_dir, fail_fast=True).check()
+        self.assertEqual(result.result, InvariantResult.FAIL)
+        self.assertEqual(len(result.details["failures"]), 1)
+        failure = result.details["failures"][0]
+        self.assertIn("first violating fit", failure["reason"])
+        self.assertEqual(failure["fit_file"], "control_plane/governor/risk_fits/fits.json")
+
     def test_budget_solvency_unknown_plan_context(self):
         self._write_safety_contract([{
             "hazard_id": "H1",
@@ -388,6 +388,8 @@ class TestPromotionInvariant(unittest.TestCase):
         ledger_dir = self.test_dir / "control_plane/ledger"
         ledger_dir.mkdir(parents=True)
         (ledger_dir / "entry.json").write_text("{not-json")
+        (ledger_dir / "list.json").write_text(json.dumps([{"entry_type": "promotion"}]))
+        (ledger_dir / "latin1.json").write_bytes(b'{"entry_type": "\xe9"}')
 
         checker = PromotionInvariant(self.test_dir)
         result = checker.check()
@@ -585,6 +587,39 @@ class TestSalvageInvariant(unittest.TestCase):
 
         self.assertEqual(result.result, InvariantResult.FAIL)
 
+    def test_salvage_malformed_unused_ledger_record_ignored(self):
+        deploy_dir = self.test_dir / "deployments"
+        deploy_dir.mkdir(parents=True)
+        (deploy_dir / "config.json").write_text(json.dumps({
+            "model_id": "model_008",
+            "salvage_artifact_id": "salvage_ok"
+        }))
+
+        ledger_dir = self.test_dir / "control_plane/ledger"
+        ledger_dir.mkdir(parents=True)
+        (ledger_dir / "entry.json").write_text(json.dumps({
+            "salvage_artifacts": [
+                {
+                    "artifact_id": "salvage_unused",
+                    "quarantine_certified": True,
+                    "transfer_tests_passed": ["x"],
+                    "taint_tags": ["tag"]
+                },
+                {"artifact_id": ["salvage_list_id"], "quarantine_certified": True},
+                {
+                    "artifact_id": "salvage_ok",
+                    "quarantine_certified": True,
+                    "transfer_tests_passed": [{"test_id": "t1", "passed": True}],
+                    "taint_tags": ["tag"]
+                }
+            ]
+        }))
+
+        checker = SalvageInvariant(self.test_dir)
+        self.assertEqual(checker.check().result, InvariantResult.PASS)
+        self.assertFalse(checker._check_salvage_certified("salvage_unused"))
+        self.assertFalse(checker._check_salvage_certified(["salvage_list_id"]))
+
     def test_salvage_invalid_ledger_json_fails(self):
         deploy_dir = self.test_dir / "deployments"
         deploy_dir.mkdir(parents=True)
@@ -614,6 +649,21 @@ class TestSalvageInvariant(unittest.TestCase):
 
         self.assertEqual(result.result, InvariantResult.SKIP)
 
+    def test_find_salvage_refs_in_document_order(self):
+        config = {
+            "salvage_artifact_id": "root",
+            "a": [{"salvage_artifacts": ["s1"]}, "leaf", [{"salvage_artifact_id": "s2"}]],
+            "b": {"c": {"salvage_artifact_id": "s3"}},
+        }
+        refs = SalvageInvariant(self.test_dir)._find_salvage_refs(config)
+        self.assertEqual(refs, [
+            {"path": "", "artifact_ids": "root"},
+            {"path": ".a[0]", "artifact_ids": ["s1"]},
+            {"path": ".a[2][0]", "artifact_ids": "s2"},
+            {"path": ".b.c", "artifact_ids": "s3"},
+        ])
+        self.assertEqual(SalvageInvariant(self.test_dir)._find_salvage_refs("scalar"), [])
+
     def test_salvage_invalid_config_json_skips(self):
         deploy_dir = self.test_dir / "deployments"
         deploy_dir.mkdir(parents=True)
@@ -667,6 +717,35 @@ class TestSalvageInvariant(unittest.TestCase):
 
         self.assertEqual(result.result, InvariantResult.FAIL)
 
+    def test_salvage_first_ledger_record_decides(self):
+        deploy_dir = self.test_dir / "deployments"
+        deploy_dir.mkdir(parents=True)
+        (deploy_dir / "config.json").write_text(json.dumps({
+            "salvage_artifacts": ["salvage_a", "salvage_b"]
+        }))
+
+        certified = {
+            "quarantine_certified": True,
+            "transfer_tests_passed": [{"test_id": "t1", "passed": True}],
+            "taint_tags": ["tag"],
+        }
+        ledger_dir = self.test_dir / "control_plane/ledger"
+        ledger_dir.mkdir(parents=True)
+        (ledger_dir / "a.json").write_text(json.dumps({
+            "salvage_artifacts": ["bad", {"artifact_id": "salvage_a", **certified}]
+        }))
+        (ledger_dir / "b.json").write_text(json.dumps({
+            "salvage_artifacts": [
+                {"artifact_id": "salvage_a"},
+                {"artifact_id": "salvage_b", **certified},
+            ]
+        }))
+
+        checker = SalvageInvariant(self.test_dir)
+        result = checker.check()
+
+        self.assertEqual(result.result, InvariantResult.PASS)
+
 
 class TestRollbackInvariant(unittest.TestCase):
     """Tests for the ROLLBACK invariant."""
@@ -956,6 +1035,16 @@ class TestContractInvariant(unittest.TestCase):
         result = ContractInvariant(self.test_dir).check()
         self.assertEqual(result.result, InvariantResult.FAIL)
 
+    def test_contract_not_mapping_fails(self):
+        contract_dir = self.test_dir / "contracts/safety_contracts"
+        contract_dir.mkdir(parents=True)
+        (contract_dir / "contract.json").write_text("[]")
+
+        checker = ContractInvariant(self.test_dir)
+        valid, reason = checker.validate_contract_change({"file": "contracts/safety_contracts/contract.json"}, {})
+        self.assertFalse(valid)
+        self.assertEqual(reason, "Contract is not a mapping")
+
     def test_contract_missing_file_fails(self):
         lattice_index = {}
         checker = ContractInvariant(self.test_dir)
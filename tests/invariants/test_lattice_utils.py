@@ -90,6 +90,12 @@ class TestLatticeUtils(unittest.TestCase):
 
         fits = lattice_utils.load_risk_fits(self.test_dir)
         self.assertEqual(len(fits), 2)
+        self.assertEqual(
+            sorted(fit["file_rel"] for fit in fits),
+            ["control_plane/governor/risk_fits/dict.json", "control_plane/governor/risk_fits/list.json"],
+        )
+        for fit in fits:
+            self.assertEqual(fit["data_with_file"], fit["data"] | {"file": fit["file_rel"]})
 
     def test_extract_plan_entries_variants(self):
         self.assertEqual(lattice_utils.extract_plan_entries([{"context_class": "any"}]), [{"context_class": "any"}])
@@ -154,6 +160,13 @@ class TestLatticeUtils(unittest.TestCase):
         with self.assertRaises(ValueError):
             lattice_utils.compute_fit_risk(fit_bad, None)
 
+        with self.assertRaisesRegex(ValueError, r"Invalid numeric 'channel_allocations\[a\]' in fit.json"):
+            lattice_utils.compute_fit_risk(fit, {"a": "bad"})
+
+        fit_bad_k = fit | {"k_low_by_channel": {"a": "bad"}}
+        with self.assertRaisesRegex(ValueError, r"Invalid numeric 'k_low\[a\]' in fit.json"):
+            lattice_utils.compute_fit_risk(fit_bad_k, {"a": 2})
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -9,14 +9,17 @@ from unittest import mock
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "ci" / "invariants"))
 
+from artifact_index import ArtifactIndex  # noqa: E402
 from base import InvariantResult  # noqa: E402
-from evidence_governance import EvidenceGovernanceInvariant  # noqa: E402
+from evidence_governance import EvidenceGovernanceInvariant, has_signed_approval  # noqa: E402
 from fit_plan_aar_consistency import FitPlanAarConsistencyInvariant  # noqa: E402
 from fit_provenance_complete import FitProvenanceCompleteInvariant  # noqa: E402
 from fit_provenance_integrity import FitProvenanceIntegrityInvariant  # noqa: E402
 import provenance_utils  # noqa: E402
 
+from evoalign import provenance  # noqa: E402
 from evoalign.provenance import sha256_canonical  # noqa: E402
+from file_utils import iter_data_files  # noqa: E402
 
 
 def write_json(path: Path, payload) -> None:
@@ -24,6 +27,10 @@ def write_json(path: Path, payload) -> None:
     path.write_text(json.dumps(payload, indent=2))
 
 
+def all_commits_exist(commits, repo_root=None):
+    return set(commits)
+
+
 def build_good_repo(root: Path) -> dict:
     contract = {"version": "0.1.0"}
     lattice = {"version": "0.1.0"}
@@ -280,13 +287,39 @@ class TestProvenanceUtils(unittest.TestCase):
         self.assertIn("sweep1", provenance_utils.load_sweeps(self.test_dir))
         self.assertEqual(len(provenance_utils.load_risk_fits(self.test_dir)), 2)
         self.assertEqual(len(provenance_utils.load_oversight_plan_files(self.test_dir)), 1)
-        self.assertEqual(len(provenance_utils.load_aars(self.test_dir)), 1)
+        aars = provenance_utils.load_aars(self.test_dir)
+        self.assertEqual(len(aars), 1)
+        self.assertEqual(aars[0]["hash"], provenance_utils.compute_object_hash(aars[0]["data"]))
         self.assertTrue(provenance_utils.compute_object_hash({"a": 1}).startswith("sha256:"))
 
     def test_registry_invalid(self):
         write_json(self.test_dir / "control_plane/evals/suites/registry.json", [])
         self.assertIsNone(provenance_utils.load_registry(self.test_dir))
 
+    def test_id_lists_materialize_as_sets(self):
+        write_json(self.test_dir / "control_plane/governor/sweeps/sweep1.json", {
+            "sweep_id": "sweep1",
+            "eval_run_ids": ["run1", 7, {"bad": 1}, "run1"],
+        })
+        write_json(self.test_dir / "control_plane/evals/suites/sets/set1.json", {
+            "suite_set_id": "set1",
+            "suite_ids": "suite1",
+        })
+        sweeps = provenance_utils.load_sweeps(self.test_dir)
+        self.assertEqual(
+            sweeps["sweep1"]["eval_run_ids"],
+            frozenset({"run1", 7, provenance_utils._INVALID_ID}),
+        )
+        suite_sets = provenance_utils.load_suite_sets(self.test_dir)
+        self.assertEqual(suite_sets["set1"]["suite_ids"], frozenset({provenance_utils._INVALID_ID}))
+
+    def test_sorted_seeds(self):
+        self.assertEqual(provenance_utils.sorted_seeds([3, 1, 2]), (1, 2, 3))
+        self.assertEqual(provenance_utils.sorted_seeds(None), ())
+        self.assertEqual(provenance_utils.sorted_seeds(["b", "a"]), ("a", "b"))
+        self.assertIsNone(provenance_utils.sorted_seeds([1, "2"]))
+        self.assertIsNone(provenance_utils.sorted_seeds("12"))
+
 
 class TestFitProvenanceCompleteInvariant(unittest.TestCase):
     def setUp(self):
@@ -295,6 +328,13 @@ class TestFitProvenanceCompleteInvariant(unittest.TestCase):
     def tearDown(self):
         shutil.rmtree(self.test_dir)
 
+    def test_is_placeholder(self):
+        checker = FitProvenanceCompleteInvariant(self.test_dir)
+        for value in (None, "", "TBD", "  placeholder  ", " " * 20 + "deadbeef", "deadbeef\n" + " " * 20):
+            self.assertTrue(checker._is_placeholder(value), value)
+        for value in ("sha256:abc", "placeholder-ish", " real value with spaces ", 0, ["tbd"]):
+            self.assertFalse(checker._is_placeholder(value), value)
+
     def test_skip_no_fits(self):
         result = FitProvenanceCompleteInvariant(self.test_dir).check()
         self.assertEqual(result.result, InvariantResult.SKIP)
@@ -324,6 +364,18 @@ class TestFitProvenanceCompleteInvariant(unittest.TestCase):
         result = FitProvenanceCompleteInvariant(self.test_dir).check()
         self.assertEqual(result.result, InvariantResult.FAIL)
 
+    def test_fail_fast_stops_at_first_failing_fit(self):
+        write_json(
+            self.test_dir / "control_plane/governor/risk_fits/fits.json",
+            [{"fit_id": "fit1"}, {"fit_id": "fit2"}],
+        )
+        result = FitProvenanceCompleteInvariant(self.test_dir).check()
+        self.assertEqual([f["fit_id"] for f in result.details["failures"]], ["fit1", "fit2"])
+
+        result = FitProvenanceCompleteInvariant(self.test_dir, fail_fast=True).check()
+        self.assertEqual(result.result, InvariantResult.FAIL)
+        self.assertEqual([f["fit_id"] for f in result.details["failures"]], ["fit1"])
+
     def test_pass(self):
         fit = {
             "fit_id": "fit1",
@@ -408,16 +460,84 @@ class TestFitProvenanceIntegrityInvariant(unittest.TestCase):
             "result_summary_hash": "sha256:res"
         }
         write_json(self.test_dir / "control_plane/evals/runs/run1.json", eval_run)
-        with mock.patch("fit_provenance_integrity.git_commit_exists", return_value=True):
+        with mock.patch("artifact_index.existing_git_commits", side_effect=all_commits_exist):
             result = FitProvenanceIntegrityInvariant(self.test_dir).check()
         self.assertEqual(result.result, InvariantResult.FAIL)
 
     def test_pass(self):
         build_good_repo(self.test_dir)
-        with mock.patch("fit_provenance_integrity.git_commit_exists", return_value=True):
+        with mock.patch("artifact_index.existing_git_commits", side_effect=all_commits_exist):
             result = FitProvenanceIntegrityInvariant(self.test_dir).check()
         self.assertEqual(result.result, InvariantResult.PASS)
 
+    def test_non_string_suite_ids_fail(self):
+        build_good_repo(self.test_dir)
+        set_path = self.test_dir / "control_plane/evals/suites/sets/set_good.json"
+        suite_set = json.loads(set_path.read_text())
+        for suite_ids in ([123], [["suite1"]], "suite1"):
+            suite_set["suite_ids"] = suite_ids
+            write_json(set_path, suite_set)
+            with mock.patch("artifact_index.existing_git_commits", side_effect=all_commits_exist):
+                result = FitProvenanceIntegrityInvariant(self.test_dir).check()
+            with self.subTest(suite_ids=suite_ids):
+                reasons = [f["reason"] for f in result.details["failures"]]
+                self.assertIn("suite_set references unknown suite_id", reasons)
+
+    def test_malformed_dataset_manifest_hash(self):
+        build_good_repo(self.test_dir)
+        manifests = self.test_dir / "control_plane/evals/datasets/manifests"
+        write_json(manifests / "ds_unused.json", {"dataset_id": "ds_unused", "dataset_hash": {"sha256": "abc"}})
+        with mock.patch("artifact_index.existing_git_commits", side_effect=all_commits_exist):
+            result = FitProvenanceIntegrityInvariant(self.test_dir).check()
+        self.assertEqual(result.result, InvariantResult.PASS)
+
+        write_json(manifests / "ds1.json", {"dataset_id": "ds1", "dataset_hash": 123})
+        with mock.patch("artifact_index.existing_git_commits", side_effect=all_commits_exist):
+            result = FitProvenanceIntegrityInvariant(self.test_dir).check()
+        self.assertEqual(
+            [f["reason"] for f in result.details["failures"]],
+            ["dataset_hash mismatch for 'ds1'"],
+        )
+
+    def test_list_fit_generator_commit_fails(self):
+        build_good_repo(self.test_dir)
+        fits_path = self.test_dir / "control_plane/governor/risk_fits/fits.json"
+        fits = json.loads(fits_path.read_text())
+        fits[0]["provenance"]["fit_generator_commit"] = ["good"]
+        write_json(fits_path, fits)
+        with mock.patch("artifact_index.existing_git_commits", side_effect=all_commits_exist):
+            result = FitProvenanceIntegrityInvariant(self.test_dir).check()
+        self.assertEqual(
+            [f["reason"] for f in result.details["failures"]],
+            ["fit_generator_commit not found: ['good']"],
+        )
+
+    def test_random_seeds_compare_order_insensitively(self):
+        build_good_repo(self.test_dir)
+        fits_path = self.test_dir / "control_plane/governor/risk_fits/fits.json"
+        fits = json.loads(fits_path.read_text())
+        fits[0]["provenance"]["random_seeds"] = [1, 2]
+        write_json(fits_path, fits)
+
+        def check_with_run_seeds(run_seeds):
+            artifacts = ArtifactIndex(self.test_dir)
+            run = artifacts.load(provenance_utils.load_eval_runs)["run_good"]
+            run["data"]["random_seeds"] = run_seeds
+            run["sorted_seeds"] = provenance_utils.sorted_seeds(run_seeds)
+            with mock.patch("artifact_index.existing_git_commits", side_effect=all_commits_exist):
+                return FitProvenanceIntegrityInvariant(self.test_dir, artifacts=artifacts).check()
+
+        self.assertEqual(check_with_run_seeds([2, 1]).result, InvariantResult.PASS)
+        self.assertEqual(check_with_run_seeds([1, 3]).result, InvariantResult.FAIL)
+        fits[0]["provenance"]["random_seeds"] = ["s2", "s1"]
+        write_json(fits_path, fits)
+        self.assertEqual(check_with_run_seeds(["s1", "s2"]).result, InvariantResult.PASS)
+        fits[0]["provenance"]["random_seeds"] = [1, "2"]
+        write_json(fits_path, fits)
+        self.assertEqual(check_with_run_seeds([1, "2"]).result, InvariantResult.PASS)
+        result = check_with_run_seeds(["2", 1])
+        self.assertEqual([f["reason"] for f in result.details["failures"]], ["random_seeds mismatch"])
+
     def test_pass_and_failures(self):
         hashes = build_good_repo(self.test_dir)
 
@@ -505,15 +625,15 @@ class TestFitProvenanceIntegrityInvariant(unittest.TestCase):
         ]
         write_json(self.test_dir / "control_plane/governor/risk_fits/fits.json", fits)
 
-        def commit_check(commit, repo_root=None):
-            return commit != "bad"
+        def commit_check(commits, repo_root=None):
+            return {commit for commit in commits if commit != "bad"}
 
-        with mock.patch("fit_provenance_integrity.git_commit_exists", side_effect=commit_check):
+        with mock.patch("artifact_index.existing_git_commits", side_effect=commit_check):
             result = FitProvenanceIntegrityInvariant(self.test_dir).check()
 
         self.assertEqual(result.result, InvariantResult.FAIL)
 
-        with mock.patch("fit_provenance_integrity.git_commit_exists", return_value=True):
+        with mock.patch("artifact_index.existing_git_commits", side_effect=all_commits_exist):
             result = FitProvenanceIntegrityInvariant(self.test_dir).check()
 
         self.assertEqual(result.result, InvariantResult.FAIL)
@@ -530,6 +650,13 @@ class TestEvidenceGovernanceInvariant(unittest.TestCase):
         result = EvidenceGovernanceInvariant(self.test_dir).check()
         self.assertEqual(result.result, InvariantResult.SKIP)
 
+    def test_has_signed_approval(self):
+        self.assertTrue(has_signed_approval([{"signature": ""}, {"signature": "sig"}]))
+        self.assertTrue(has_signed_approval(["bad", {"signature": "sig"}]))
+        self.assertFalse(has_signed_approval(["bad", {"role": "Lead"}]))
+        self.assertFalse(has_signed_approval({"signature": "sig"}))
+        self.assertFalse(has_signed_approval([]))
+
     def test_fail(self):
         fit = {
             "fit_id": "fit1",
@@ -617,10 +744,58 @@ class TestFitPlanAarConsistencyInvariant(unittest.TestCase):
 
     def test_pass_without_aars(self):
         build_good_repo(self.test_dir)
-        with mock.patch("fit_plan_aar_consistency.git_commit_exists", return_value=True):
+        with mock.patch("artifact_index.existing_git_commits", side_effect=all_commits_exist):
             result = FitPlanAarConsistencyInvariant(self.test_dir).check()
         self.assertEqual(result.result, InvariantResult.PASS)
 
+    def test_list_governor_commit_fails(self):
+        build_good_repo(self.test_dir)
+        plan_path = self.test_dir / "control_plane/governor/oversight_plans/plan.json"
+        plan = json.loads(plan_path.read_text())
+        plan["provenance"]["governor_commit"] = ["good"]
+        write_json(plan_path, plan)
+        with mock.patch("artifact_index.existing_git_commits", side_effect=all_commits_exist):
+            result = FitPlanAarConsistencyInvariant(self.test_dir).check()
+        self.assertEqual(result.result, InvariantResult.FAIL)
+        self.assertIn(
+            "governor_commit not found: ['good']",
+            [failure["reason"] for failure in result.details["failures"]],
+        )
+
+    def test_unreferenced_fit_with_malformed_provenance_passes(self):
+        build_good_repo(self.test_dir)
+        fits_path = self.test_dir / "control_plane/governor/risk_fits/fits.json"
+        fits = json.loads(fits_path.read_text())
+        fits.append({"fit_id": "fit_tbd", "provenance": "TBD"})
+        write_json(fits_path, fits)
+        with mock.patch("artifact_index.existing_git_commits", side_effect=all_commits_exist):
+            result = FitPlanAarConsistencyInvariant(self.test_dir).check()
+        self.assertEqual(result.result, InvariantResult.PASS)
+
+    def test_plans_not_hashed_without_aars(self):
+        build_good_repo(self.test_dir)
+        with mock.patch("artifact_index.existing_git_commits", side_effect=all_commits_exist):
+            with mock.patch("fit_plan_aar_consistency.compute_object_hash") as compute_hash:
+                result = FitPlanAarConsistencyInvariant(self.test_dir).check()
+        self.assertEqual(result.result, InvariantResult.PASS)
+        compute_hash.assert_not_called()
+
+    def test_contract_and_lattice_hashes_use_shared_cache(self):
+        build_good_repo(self.test_dir)
+        cache = provenance.HashCache()
+        with mock.patch.object(provenance, "sha256_data_file", wraps=provenance.sha256_data_file) as wrapped:
+            for _ in range(2):
+                checker = FitPlanAarConsistencyInvariant(self.test_dir, hash_cache=cache)
+                contract_hashes = checker._load_contract_hashes()
+                checker._load_lattice_hashes()
+        files = iter_data_files(self.test_dir / "contracts/safety_contracts")
+        self.assertEqual(
+            contract_hashes,
+            frozenset(provenance.normalize_hash(provenance.sha256_data_file(path)) for path in files),
+        )
+        files += iter_data_files(self.test_dir / "contracts/context_lattice")
+        self.assertEqual(wrapped.call_count, len(files))
+
     def test_with_aars_failures(self):
         hashes = build_good_repo(self.test_dir)
 
@@ -771,10 +946,10 @@ class TestFitPlanAarConsistencyInvariant(unittest.TestCase):
         }
         write_json(self.test_dir / "aars/aar_bad_entries.json", aar_bad_entries)
 
-        def commit_check(commit, repo_root=None):
-            return commit != "bad_commit"
+        def commit_check(commits, repo_root=None):
+            return {commit for commit in commits if commit != "bad_commit"}
 
-        with mock.patch("fit_plan_aar_consistency.git_commit_exists", side_effect=commit_check):
+        with mock.patch("artifact_index.existing_git_commits", side_effect=commit_check):
             result = FitPlanAarConsistencyInvariant(self.test_dir).check()
 
         self.assertEqual(result.result, InvariantResult.FAIL)
@@ -816,7 +991,7 @@ class TestFitPlanAarConsistencyInvariant(unittest.TestCase):
         }
         write_json(self.test_dir / "aars/aar_mismatch.json", aar)
 
-        with mock.patch("fit_plan_aar_consistency.git_commit_exists", return_value=True):
+        with mock.patch("artifact_index.existing_git_commits", side_effect=all_commits_exist):
             result = FitPlanAarConsistencyInvariant(self.test_dir).check()
 
         self.assertEqual(result.result, InvariantResult.FAIL)
@@ -880,7 +1055,7 @@ class TestFitPlanAarConsistencyInvariant(unittest.TestCase):
         }
         write_json(self.test_dir / "aars/aar_multi_commit.json", aar)
 
-        with mock.patch("fit_plan_aar_consistency.git_commit_exists", return_value=True):
+        with mock.patch("artifact_index.existing_git_commits", side_effect=all_commits_exist):
             result = FitPlanAarConsistencyInvariant(self.test_dir).check()
 
         self.assertEqual(result.result, InvariantResult.FAIL)
@@ -163,6 +163,46 @@ class TestRuntimeConfigInvariant(unittest.TestCase):
         result = RuntimeConfigInvariant(self.test_dir).check()
         self.assertEqual(result.result, InvariantResult.FAIL)
 
+    def test_monitoring_threshold_uses_first_config_entry_per_metric(self):
+        self._write_aar("aar_v1", operational_controls={
+            "monitoring": {
+                "alerting_thresholds": [{"metric": "incident_rate", "threshold": 0.01}]
+            }
+        })
+        self._write_config("monitoring.json", {
+            "config_version": "1.0",
+            "alerting": {"thresholds": [
+                "not-a-dict",
+                {"metric": "incident_rate", "threshold": 0.01},
+                {"metric": "incident_rate", "threshold": 0.05},
+            ]},
+            "aar_reference": "aar_v1",
+        })
+        result = RuntimeConfigInvariant(self.test_dir).check()
+        self.assertEqual(result.result, InvariantResult.PASS)
+
+    def test_monitoring_non_string_metrics_match(self):
+        self._write_aar("aar_v1", operational_controls={
+            "monitoring": {
+                "metrics_collected": [7],
+                "alerting_thresholds": [
+                    {"metric": 7, "threshold": 0.01},
+                    {"metric": ["a"], "threshold": 0.02},
+                ],
+            }
+        })
+        self._write_config("monitoring.json", {
+            "config_version": "1.0",
+            "metrics": {"collected": [7]},
+            "alerting": {"thresholds": [
+                {"metric": 7, "threshold": 0.01},
+                {"metric": ["a"], "threshold": 0.02},
+            ]},
+            "aar_reference": "aar_v1",
+        })
+        result = RuntimeConfigInvariant(self.test_dir).check()
+        self.assertEqual(result.result, InvariantResult.PASS)
+
     def test_pass_empty_aar_claims(self):
         self._write_aar("aar_v1")  # No stability or operational claims
         self._write_config("damping.json", {
@@ -6,17 +6,24 @@ import sys
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
+
+from jsonschema import ValidationError
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "ci" / "invariants"))
 
 from base import InvariantResult  # noqa: E402
+import file_index  # noqa: E402
 from schema_validation import (  # noqa: E402
     SchemaTarget,
     SchemaValidationInvariant,
+    compile_validator,
     iter_target_files,
     load_data_file,
     main,
+    validate_data_files,
+    validate_schema_files,
 )
 
 
@@ -81,6 +88,20 @@ class TestSchemaValidationInvariant(unittest.TestCase):
         result = SchemaValidationInvariant(self.test_dir).check()
         self.assertEqual(result.result, InvariantResult.FAIL)
 
+    def test_errors_reported_in_target_order(self):
+        write_json(self.test_dir / "schemas/SafetyContract.schema.json", {"type": "object"})
+        write_json(self.test_dir / "schemas/AAR.schema.json", {"type": "object"})
+        write_yaml(self.test_dir / "contracts/safety_contracts/contract.yaml", "- bad\n")
+        write_yaml(self.test_dir / "contracts/context_lattice/lattice.yaml", "version: 0.1.0\n")
+        write_json(self.test_dir / "aars/a.json", [])
+
+        validated, errors = validate_data_files(self.test_dir)
+        self.assertEqual(validated, 0)
+        self.assertEqual(
+            [error["file"] for error in errors],
+            ["contracts/safety_contracts/contract.yaml", "contracts/context_lattice", "aars/a.json"],
+        )
+
     def test_fail_invalid_schema(self):
         write_json(
             self.test_dir / "schemas/Bad.schema.json",
@@ -89,6 +110,54 @@ class TestSchemaValidationInvariant(unittest.TestCase):
         result = SchemaValidationInvariant(self.test_dir).check()
         self.assertEqual(result.result, InvariantResult.FAIL)
 
+    def test_fail_invalid_target_schema_reported_per_file(self):
+        write_json(self.test_dir / "schemas/AAR.schema.json", {"type": "unknown"})
+        write_json(self.test_dir / "aars/a.json", {})
+        write_json(self.test_dir / "aars/b.json", {})
+
+        result = SchemaValidationInvariant(self.test_dir).check()
+        self.assertEqual(result.result, InvariantResult.FAIL)
+        failed = [f["file"] for f in result.details["failures"] if f["file"].startswith("aars/")]
+        self.assertEqual(failed, ["aars/a.json", "aars/b.json"])
+
+    def test_compile_validator_matches_validate(self):
+        validate_instance = compile_validator(
+            {"type": "object", "required": ["version"], "properties": {"version": {"type": "string"}}}
+        )
+        validate_instance({"version": "1"})
+        with self.assertRaises(ValidationError) as ctx:
+            validate_instance({"version": 1})
+        self.assertEqual(ctx.exception.message, "1 is not of type 'string'")
+
+    def test_schema_check_cached_until_file_changes(self):
+        schema_path = self.test_dir / "schemas/AAR.schema.json"
+        write_json(schema_path, {"type": "object"})
+        with mock.patch(
+            "schema_validation.Draft202012Validator.check_schema",
+        ) as check_schema:
+            self.assertEqual(validate_schema_files(self.test_dir), [])
+            self.assertEqual(validate_schema_files(self.test_dir), [])
+            self.assertEqual(check_schema.call_count, 1)
+            write_json(schema_path, {"type": "object", "title": "AAR"})
+            validate_schema_files(self.test_dir)
+            self.assertEqual(check_schema.call_count, 2)
+
+    def test_fail_dangling_schema_symlink(self):
+        (self.test_dir / "schemas/Gone.schema.json").symlink_to(self.test_dir / "missing.json")
+        errors = validate_schema_files(self.test_dir)
+        self.assertEqual([error["file"] for error in errors], ["schemas/Gone.schema.json"])
+
+    def test_runtime_targets_share_one_listing(self):
+        for schema in ("DampingConfig", "MonitoringConfig"):
+            write_json(self.test_dir / f"schemas/{schema}.schema.json", {"type": "object"})
+        write_json(self.test_dir / "control_plane/runtime/damping.json", {})
+        write_json(self.test_dir / "control_plane/runtime/monitoring.json", {})
+
+        with mock.patch.object(file_index, "iter_data_files", wraps=file_index.iter_data_files) as listing:
+            validated, errors = validate_data_files(self.test_dir)
+        self.assertEqual((validated, errors), (2, []))
+        listing.assert_called_once_with(self.test_dir / "control_plane/runtime")
+
     def test_fail_invalid_json_data(self):
         write_json(
             self.test_dir / "schemas/AAR.schema.json",
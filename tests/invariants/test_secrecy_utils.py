@@ -9,8 +9,15 @@ from unittest import mock
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "ci" / "invariants"))
 
+from artifact_index import ArtifactIndex  # noqa: E402
 from evoalign.provenance import sha256_data_file  # noqa: E402
-from evoalign.secrecy_fingerprints import HashingScheme, SecrecyFingerprintError, fingerprint_item  # noqa: E402
+from evoalign.secrecy_fingerprints import (  # noqa: E402
+    HashingScheme,
+    SecrecyFingerprintError,
+    fingerprint_item,
+    load_hash_registry,
+)
+from file_utils import load_data_file  # noqa: E402
 from secrecy_utils import (  # noqa: E402
     build_secret_fingerprint_index,
     build_secrecy_audit,
@@ -81,6 +88,27 @@ class TestSecrecyUtils(unittest.TestCase):
         self.assertEqual(registry_hash, loaded_hash)
         self.assertIsInstance(registry, dict)
 
+    def test_registries_hashed_from_parsed_data(self):
+        registry_hash = self._write_suite_registry([])
+        self._write_secret_registry(registry_hash, [])
+        with mock.patch("evoalign.provenance.sha256_data_file") as reparse:
+            self.assertEqual(load_suite_registry(self.test_dir)[1], registry_hash)
+            load_secret_hash_registry(self.test_dir)
+        reparse.assert_not_called()
+
+    def test_registries_parsed_once_per_artifact_index(self):
+        registry_hash = self._write_suite_registry([])
+        self._write_secret_registry(registry_hash, [])
+        artifacts = ArtifactIndex(self.test_dir)
+        with mock.patch("secrecy_utils.load_data_file", wraps=load_data_file) as parse_suites, \
+                mock.patch("secrecy_utils.load_hash_registry", wraps=load_hash_registry) as parse_secret:
+            for _ in range(2):
+                registry, loaded_hash = load_suite_registry(self.test_dir, artifacts=artifacts)
+                secret_registry, _, _ = load_secret_hash_registry(self.test_dir, artifacts=artifacts)
+        self.assertEqual(loaded_hash, registry_hash)
+        self.assertEqual(secret_registry["registry_version"], "1.0")
+        self.assertEqual((parse_suites.call_count, parse_secret.call_count), (1, 1))
+
     def test_get_secret_suites(self):
         registry = {
             "suites": [
@@ -209,6 +209,34 @@ class TestScanning(unittest.TestCase):
         self.assertEqual(fingerprints, [])
         self.assertTrue(errors)
 
+    def test_scan_skips_unreadable_dirs_and_sorts_files(self):
+        training_dir = self.test_dir / "training"
+        (training_dir / "b").mkdir(parents=True)
+        (training_dir / "b" / "two.txt").write_text("two")
+        (training_dir / "a.txt").write_text("one")
+        (training_dir / "file.txt").write_text("not a directory")
+
+        protected_paths = ["training", "training/file.txt"]
+        scan_result = scan_protected_paths(self.test_dir, self.scheme, protected_paths=protected_paths)
+        self.assertEqual(scan_result.scanned_files, ["training/a.txt", "training/b/two.txt", "training/file.txt"])
+
+        with mock.patch("evoalign.secrecy_fingerprints.os.scandir", side_effect=PermissionError):
+            scan_result = scan_protected_paths(self.test_dir, self.scheme, protected_paths=["training"])
+        self.assertEqual(scan_result.scanned_files, [])
+
+    def test_scan_reports_paths_relative_to_dot_root(self):
+        training_dir = self.test_dir / "training"
+        training_dir.mkdir(parents=True)
+        (training_dir / "a.txt").write_text("one")
+
+        cwd = os.getcwd()
+        os.chdir(self.test_dir)
+        try:
+            scan_result = scan_protected_paths(Path("."), self.scheme, protected_paths=["training"])
+        finally:
+            os.chdir(cwd)
+        self.assertEqual(scan_result.scanned_files, ["training/a.txt"])
+
     def test_scan_text_blocks_empty_fingerprint(self):
         text_path = self.test_dir / "notes.txt"
         text_path.write_text("para one\n\npara two\n")
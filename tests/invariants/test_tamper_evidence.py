@@ -5,11 +5,16 @@ import shutil
 import tempfile
 import unittest
 from pathlib import Path
+from unittest import mock
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "ci" / "invariants"))
 
+import ledger_utils  # noqa: E402
+from artifact_index import ArtifactIndex  # noqa: E402
 from base import InvariantResult  # noqa: E402
+from evoalign.provenance import HashCache  # noqa: E402
+from lineage_integrity import LineageIntegrityInvariant  # noqa: E402
 from evoalign.merkle import compute_artifact_merkle_root, merkle_root  # noqa: E402
 from evoalign.provenance import sha256_canonical  # noqa: E402
 from tamper_evidence import (  # noqa: E402
@@ -253,6 +258,22 @@ class TestTamperEvidenceInvariant(unittest.TestCase):
         # Should pass because we can't verify without artifacts
         self.assertEqual(result.result, InvariantResult.PASS)
 
+    def test_lineage_entries_shared_with_lineage_integrity(self):
+        entry = {"entry_id": "e1", "provenance": {"rfc_reference": "RFC", "approvals": [{"role": "Lead"}]}}
+        write_json(self.test_dir / "lineage/e1.json", entry)
+        self._write_aar("aar.json", {
+            "aar_id": "a1",
+            "lineage_references": {"ledger_root_hash": merkle_root([sha256_canonical(entry)])},
+        })
+        hash_cache = HashCache()
+        artifacts = ArtifactIndex(self.test_dir)
+        with mock.patch("ledger_utils.load_data_files", wraps=ledger_utils.load_data_files) as load:
+            lineage = LineageIntegrityInvariant(self.test_dir, hash_cache=hash_cache, artifacts=artifacts).check()
+            tamper = TamperEvidenceInvariant(self.test_dir, hash_cache=hash_cache, artifacts=artifacts).check()
+        self.assertEqual(lineage.result, InvariantResult.PASS)
+        self.assertEqual(tamper.result, InvariantResult.PASS)
+        self.assertEqual(load.call_count, 1)
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -6,11 +6,18 @@ import os
 import runpy
 import shutil
 import tempfile
+import threading
+import time
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from unittest import mock
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent / "ci" / "invariants"))
+from artifact_index import ArtifactIndex  # noqa: E402
+import file_index  # noqa: E402
+from file_index import RepoFileIndex  # noqa: E402
 from base import InvariantCheck, InvariantChecker, InvariantResult  # noqa: E402
 import check_invariants  # noqa: E402
 import context_inventory  # noqa: E402
@@ -46,6 +53,149 @@ class TestFileUtils(unittest.TestCase):
 
         files = file_utils.iter_data_files(self.test_dir)
         self.assertEqual([f.name for f in files], ["a.json", "b.yaml"])
+        self.assertEqual([f.name for f in file_utils.iter_json_files(self.test_dir)], ["a.json"])
+
+    def test_iter_data_files_matches_rglob(self):
+        (self.test_dir / "a").mkdir()
+        (self.test_dir / "a/nested.yml").write_text("value: 1")
+        (self.test_dir / "a.json").write_text("{}")
+        (self.test_dir / ".hidden").mkdir()
+        (self.test_dir / ".hidden/x.json").write_text("{}")
+        (self.test_dir / ".json").write_text("{}")
+        (self.test_dir / "dir.json").mkdir()
+        (self.test_dir / "linked").symlink_to(self.test_dir / "a", target_is_directory=True)
+        (self.test_dir / "link.json").symlink_to(self.test_dir / "a.json")
+
+        expected = sorted(
+            path for path in self.test_dir.rglob("*")
+            if path.is_file() and path.suffix in file_utils.DATA_SUFFIXES
+        )
+        self.assertEqual(file_utils.iter_data_files(self.test_dir), expected)
+
+    def test_iter_data_files_skips_unreadable_dirs(self):
+        with mock.patch.object(file_utils.os, "scandir", side_effect=PermissionError):
+            self.assertEqual(file_utils.iter_data_files(self.test_dir), [])
+
+    def test_relative_str(self):
+        nested = self.test_dir / "a" / "b.json"
+        self.assertEqual(file_utils.relative_str(nested, self.test_dir), str(Path("a") / "b.json"))
+        self.assertEqual(file_utils.relative_str(Path("a/b.json"), Path(".")), "a/b.json")
+        with self.assertRaises(ValueError):
+            file_utils.relative_str(Path(f"{self.test_dir}x") / "b.json", self.test_dir)
+
+    def test_map_files_preserves_order(self):
+        self.assertEqual(file_utils.map_files(str, []), [])
+        self.assertEqual(file_utils.map_files(str, [Path("one")]), ["one"])
+        paths = [Path(f"file_{index}") for index in range(10)]
+        self.assertEqual(file_utils.map_files(str, paths), [str(path) for path in paths])
+
+    def test_map_files_shares_one_bounded_pool(self):
+        def worker_name(path):
+            time.sleep(0.001)
+            return threading.current_thread().name
+
+        paths = [Path(f"file_{index}") for index in range(50)]
+        # As under the parallel runner: several invariants mapping files at once.
+        with ThreadPoolExecutor(max_workers=8) as outer:
+            names = [name for batch in outer.map(lambda _: file_utils.map_files(worker_name, paths), range(8))
+                     for name in batch]
+        self.assertTrue(all(name.startswith("evoalign-files") for name in names))
+        self.assertLessEqual(len(set(names)), file_utils.MAX_FILE_WORKERS)
+
+    def test_map_files_nested_call_runs_inline(self):
+        paths = [Path(f"file_{index}") for index in range(file_utils.MAX_FILE_WORKERS * 2)]
+        nested = file_utils.map_files(lambda path: file_utils.map_files(str, [path, path]), paths)
+        self.assertEqual(nested, [[str(path), str(path)] for path in paths])
+
+    def test_load_data_files_preserves_order_and_errors(self):
+        paths = []
+        for index in range(5):
+            paths.append(self.test_dir / f"file_{index}.json")
+            paths[-1].write_text(json.dumps({"index": index}))
+        bad_path = self.test_dir / "bad.json"
+        bad_path.write_text("{")
+
+        loaded = file_utils.load_data_files(paths)
+        self.assertEqual([data["index"] for _, data in loaded], list(range(5)))
+        self.assertEqual([path for path, _ in loaded], paths)
+
+        skipped = file_utils.load_data_files([bad_path, *paths], skip_errors=True)
+        self.assertEqual([path for path, _ in skipped], paths)
+        with self.assertRaises(json.JSONDecodeError):
+            file_utils.load_data_files([*paths, bad_path])
+
+    def test_repo_file_index_walks_each_tree_once(self):
+        (self.test_dir / "a.json").write_text("{}")
+        index = RepoFileIndex()
+        with mock.patch.object(file_utils.os, "scandir", wraps=os.scandir) as scandir:
+            first = index.data_files(self.test_dir)
+            self.assertIs(index.data_files(self.test_dir), first)
+        self.assertEqual(scandir.call_count, 1)
+        self.assertEqual(first, (self.test_dir / "a.json",))
+
+    def test_repo_file_index_parses_each_file_once(self):
+        data_path = self.test_dir / "a.json"
+        data_path.write_text(json.dumps({"a": 1}))
+        index = RepoFileIndex()
+        with mock.patch.object(file_index, "load_data_file", wraps=file_utils.load_data_file) as parse:
+            first = index.load_data_file(data_path)
+            self.assertIs(index.load_data_file(data_path), first)
+            self.assertEqual(parse.call_count, 1)
+
+            data_path.write_text(json.dumps({"a": 12}))
+            self.assertEqual(index.load_data_file(data_path), {"a": 12})
+            self.assertEqual(parse.call_count, 2)
+
+    def test_repo_file_index_concurrent_misses_share_one_document(self):
+        data_path = self.test_dir / "a.json"
+        data_path.write_text(json.dumps({"a": 1}))
+        index = RepoFileIndex()
+        both_missed = threading.Barrier(2)
+
+        def parse(path):
+            both_missed.wait(timeout=5)
+            return file_utils.load_data_file(path)
+
+        with mock.patch.object(file_index, "load_data_file", side_effect=parse) as parsed:
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                first, second = executor.map(lambda _: index.load_data_file(data_path), range(2))
+        # Both threads computed the document, but only the first stored copy is handed out.
+        self.assertEqual(parsed.call_count, 2)
+        self.assertIs(first, second)
+
+    def test_artifact_index_memoizes_loaders(self):
+        loader = mock.Mock(return_value=["record"])
+        index = ArtifactIndex(Path("root"))
+        self.assertEqual(index.load(loader), ["record"])
+        self.assertIs(index.load(loader), index.load(loader))
+        loader.assert_called_once_with(Path("root"))
+
+    def test_artifact_index_shares_aar_index(self):
+        aars = [
+            {"data": {"aar_id": "aar_v1", "n": 1}},
+            {"data": {"aar_id": "", "n": 2}},
+            {"data": {"n": 3}},
+        ]
+        index = ArtifactIndex(Path("root"))
+        with mock.patch("artifact_index.load_aars", return_value=aars) as load:
+            self.assertEqual(index.aar_index(), {"aar_v1": {"aar_id": "aar_v1", "n": 1}})
+            self.assertIs(index.aar_index(), index.aar_index())
+        load.assert_called_once_with(Path("root"))
+
+    def test_artifact_index_resolves_each_commit_once(self):
+        index = ArtifactIndex(Path("root"))
+        with mock.patch("artifact_index.existing_git_commits", return_value={"a"}) as resolve:
+            self.assertEqual(index.existing_commits(["a", "b", None]), {"a"})
+            self.assertEqual(index.existing_commits(["b", "a"]), {"a"})
+        resolve.assert_called_once_with({"a", "b"}, Path("root"))
+
+    def test_artifact_index_does_not_cache_errors(self):
+        loader = mock.Mock(side_effect=ValueError("bad"))
+        index = ArtifactIndex(Path("root"))
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                index.load(loader)
+        self.assertEqual(loader.call_count, 2)
 
 
 class TestContextScan(unittest.TestCase):
@@ -63,8 +213,21 @@ class TestContextScan(unittest.TestCase):
                 {"nested": {"context_class": "no_tools"}},
             ],
         }
-        results = context_scan._find_context_classes(data)
-        self.assertEqual({r["context_class"] for r in results}, {"any", "tool_access:any", "no_tools"})
+        results = list(context_scan._iter_context_classes(data))
+        self.assertEqual(results, [
+            {"context_class": "any", "path": "context_class"},
+            {"context_class": "tool_access:any", "path": "items[0].context_class"},
+            {"context_class": "no_tools", "path": "items[1].nested.context_class"},
+        ])
+
+    def test_find_context_classes_path_formatting(self):
+        data = [{"": {"context_class": "any"}}, {0: [[{"context_class": "no_tools"}]]}]
+        results = list(context_scan._iter_context_classes(data))
+        self.assertEqual(results, [
+            {"context_class": "any", "path": "[0]..context_class"},
+            {"context_class": "no_tools", "path": "[1].0[0][0].context_class"},
+        ])
+        self.assertEqual(list(context_scan._iter_context_classes({"context_class": 1})), [])
 
     def test_scan_context_classes(self):
         contracts_dir = self.test_dir / "contracts/safety_contracts"
@@ -81,6 +244,19 @@ class TestContextScan(unittest.TestCase):
         found = sorted({r["context_class"] for r in results})
         self.assertEqual(found, ["any", "tool_access:any"])
 
+    def test_scan_context_classes_skips_parse_without_key(self):
+        contracts_dir = self.test_dir / "contracts/safety_contracts"
+        contracts_dir.mkdir(parents=True)
+        (contracts_dir / "plain.yaml").write_text("name: unrelated")
+        (contracts_dir / "escaped.json").write_text('{"context\\u005fclass": "any"}')
+        (contracts_dir / "direct.yaml").write_text("context_class: no_tools")
+
+        parse = mock.Mock(wraps=file_utils.load_data_file)
+        results = context_scan.scan_context_classes(self.test_dir, ["contracts/safety_contracts"], parse=parse)
+        parsed = sorted(call.args[0].name for call in parse.call_args_list)
+        self.assertEqual(parsed, ["direct.yaml", "escaped.json"])
+        self.assertEqual(sorted(r["context_class"] for r in results), ["any", "no_tools"])
+
 
 class TestContextInventory(unittest.TestCase):
     def setUp(self):
@@ -185,6 +361,24 @@ class TestLocCheck(unittest.TestCase):
         files = loc_check.collect_python_files(self.test_dir)
         self.assertEqual(files, [file_path])
 
+    def test_count_loc_edge_cases(self):
+        file_path = self.test_dir / "example.py"
+        file_path.write_text("")
+        self.assertEqual(loc_check.count_loc(file_path), 0)
+        file_path.write_bytes(b"line1\r\nline2")
+        self.assertEqual(loc_check.count_loc(file_path), 2)
+
+    def test_collect_prunes_excluded_dirs(self):
+        nested = self.test_dir / "pkg" / "__pycache__"
+        nested.mkdir(parents=True)
+        kept = self.test_dir / "pkg" / "mod.py"
+        kept.write_text("x = 1\n")
+        (nested / "mod.py").write_text("x = 1\n")
+        (self.test_dir / "pkg" / "notes.txt").write_text("ignored\n")
+
+        self.assertEqual(loc_check.collect_python_files(self.test_dir, {"__pycache__"}), [kept])
+        self.assertEqual(len(loc_check.collect_python_files(self.test_dir)), 2)
+
     def test_loc_check_with_and_without_violation(self):
         file_path = self.test_dir / "example.py"
         file_path.write_text("line1\nline2\nline3\n")
@@ -257,6 +451,32 @@ class DummyInvariantDetails(InvariantChecker):
         )
 
 
+class DummyInvariantCache(InvariantChecker):
+    seen_caches = []
+
+    def check(self) -> InvariantCheck:
+        self.seen_caches.append((self.hash_cache, self.artifacts))
+        return InvariantCheck("DUMMY_CACHE", InvariantResult.PASS, "ok")
+
+
+class DummyInvariantHashing(InvariantChecker):
+    def check(self) -> InvariantCheck:
+        self.hash_cache.sha256_data_file(Path(self.repo_root) / "data.json")
+        return InvariantCheck("HASHING", InvariantResult.PASS, "ok")
+
+
+class DummyInvariantRecorder(InvariantChecker):
+    started = []
+
+    def check(self) -> InvariantCheck:
+        self.started.append(self.fail_fast)
+        return InvariantCheck("DUMMY_RECORDER", InvariantResult.PASS, "ok")
+
+
+def spec(invariant_class: type) -> str:
+    return f"{__name__}.{invariant_class.__name__}"
+
+
 class TestCheckInvariantsRunner(unittest.TestCase):
     def setUp(self):
         self.original_invariants = check_invariants.ALL_INVARIANTS
@@ -270,18 +490,108 @@ class TestCheckInvariantsRunner(unittest.TestCase):
             os.environ["REPO_ROOT"] = self.prev_repo_root
 
     def test_run_all_invariants_pass_and_fail(self):
-        check_invariants.ALL_INVARIANTS = [DummyInvariantPass]
+        check_invariants.ALL_INVARIANTS = [spec(DummyInvariantPass)]
         results = check_invariants.run_all_invariants(Path("."))
         self.assertTrue(results["all_passed"])
 
-        check_invariants.ALL_INVARIANTS = [DummyInvariantFail]
+        check_invariants.ALL_INVARIANTS = [spec(DummyInvariantFail)]
         results = check_invariants.run_all_invariants(Path("."))
         self.assertFalse(results["all_passed"])
 
+    def test_run_all_invariants_shares_caches(self):
+        DummyInvariantCache.seen_caches = []
+        check_invariants.ALL_INVARIANTS = [spec(DummyInvariantCache), spec(DummyInvariantCache)]
+        check_invariants.run_all_invariants(Path("."))
+        (first_hashes, first_artifacts), (second_hashes, second_artifacts) = DummyInvariantCache.seen_caches
+        self.assertIs(first_hashes, second_hashes)
+        self.assertIs(first_artifacts, second_artifacts)
+
+    def test_run_all_invariants_parallel_matches_serial(self):
+        check_invariants.ALL_INVARIANTS = [
+            spec(DummyInvariantFail),
+            spec(DummyInvariantPass),
+            spec(DummyInvariantDetails),
+        ]
+        parallel = check_invariants.run_all_invariants(Path("."))
+        with mock.patch.dict(os.environ, {"INVARIANT_SERIAL": "1"}):
+            serial = check_invariants.run_all_invariants(Path("."))
+        self.assertEqual(parallel, serial)
+        self.assertEqual([r["name"] for r in parallel["results"]], ["DUMMY_FAIL", "DUMMY", "DUMMY_DETAILS"])
+        self.assertFalse(parallel["all_passed"])
+
+    def test_run_all_invariants_fail_fast(self):
+        check_invariants.ALL_INVARIANTS = [
+            spec(DummyInvariantPass),
+            spec(DummyInvariantFail),
+            spec(DummyInvariantDetails),
+        ]
+        for serial in ("0", "1"):
+            env = {"INVARIANT_FAIL_FAST": "1", "INVARIANT_SERIAL": serial}
+            with mock.patch.dict(os.environ, env):
+                results = check_invariants.run_all_invariants(Path("."))
+            self.assertEqual([r["name"] for r in results["results"]], ["DUMMY", "DUMMY_FAIL"])
+            self.assertFalse(results["all_passed"])
+
+    def test_run_all_invariants_fail_fast_serial_skips_later_invariants(self):
+        DummyInvariantRecorder.started = []
+        check_invariants.ALL_INVARIANTS = [
+            spec(DummyInvariantRecorder),
+            spec(DummyInvariantFail),
+            spec(DummyInvariantRecorder),
+        ]
+        env = {"INVARIANT_FAIL_FAST": "1", "INVARIANT_SERIAL": "1"}
+        with mock.patch.dict(os.environ, env):
+            results = check_invariants.run_all_invariants(Path("."))
+        self.assertEqual([r["name"] for r in results["results"]], ["DUMMY_RECORDER", "DUMMY_FAIL"])
+        # Only the invariant before the failure ran, and it was told to stop early too.
+        self.assertEqual(DummyInvariantRecorder.started, [True])
+
+    def test_run_all_invariants_only_selected_modules(self):
+        check_invariants.ALL_INVARIANTS = [spec(DummyInvariantPass), "missing_module.MissingInvariant"]
+        results = check_invariants.run_all_invariants(Path("."), only=[__name__])
+        self.assertEqual([r["name"] for r in results["results"]], ["DUMMY"])
+
+        with self.assertRaises(ValueError):
+            check_invariants.run_all_invariants(Path("."), only=["nope"])
+
+    def test_main_only_option(self):
+        check_invariants.ALL_INVARIANTS = [spec(DummyInvariantPass), "missing_module.MissingInvariant"]
+        with contextlib.redirect_stdout(io.StringIO()) as out:
+            result = check_invariants.main(["--only", __name__])
+        self.assertEqual(result, 0)
+        self.assertIn("DUMMY: PASS", out.getvalue())
+
+        with contextlib.redirect_stderr(io.StringIO()) as err:
+            with self.assertRaises(SystemExit) as exc:
+                check_invariants.main(["--only", "nope"])
+        self.assertEqual(exc.exception.code, 2)
+        self.assertIn("invalid choice: 'nope'", err.getvalue())
+
+    def test_run_all_invariants_refuses_digest_cache_in_repo(self):
+        test_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, test_dir)
+        check_invariants.ALL_INVARIANTS = [spec(DummyInvariantPass)]
+        with mock.patch.dict(os.environ, {"EVOALIGN_DIGEST_CACHE": str(test_dir / "digests.json")}):
+            with self.assertRaises(ValueError):
+                check_invariants.run_all_invariants(test_dir)
+        self.assertFalse((test_dir / "digests.json").exists())
+
+    def test_run_all_invariants_persists_digest_cache(self):
+        test_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, test_dir)
+        (test_dir / "data.json").write_text("{}")
+        cache_dir = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, cache_dir)
+        cache_path = cache_dir / "digests.json"
+        check_invariants.ALL_INVARIANTS = [spec(DummyInvariantHashing)]
+        with mock.patch.dict(os.environ, {"EVOALIGN_DIGEST_CACHE": str(cache_path)}):
+            check_invariants.run_all_invariants(test_dir)
+        self.assertEqual(len(json.loads(cache_path.read_text())), 1)
+
     def test_main_with_details(self):
-        check_invariants.ALL_INVARIANTS = [DummyInvariantDetails]
+        check_invariants.ALL_INVARIANTS = [spec(DummyInvariantDetails)]
         with contextlib.redirect_stdout(io.StringIO()):
-            result = check_invariants.main()
+            result = check_invariants.main([])
         self.assertEqual(result, 0)
 
     def test_main_failure_branch(self):
@@ -290,7 +600,7 @@ class TestCheckInvariantsRunner(unittest.TestCase):
         try:
             os.environ["REPO_ROOT"] = str(temp_dir)
             with contextlib.redirect_stdout(io.StringIO()):
-                result = check_invariants.main()
+                result = check_invariants.main([])
             self.assertEqual(result, 1)
         finally:
             shutil.rmtree(temp_dir)
@@ -298,9 +608,10 @@ class TestCheckInvariantsRunner(unittest.TestCase):
     def test_main_as_script(self):
         repo_root = Path(__file__).resolve().parents[2]
         os.environ["REPO_ROOT"] = str(repo_root)
-        with contextlib.redirect_stdout(io.StringIO()):
+        script = repo_root / "ci/invariants/check_invariants.py"
+        with contextlib.redirect_stdout(io.StringIO()), mock.patch.object(sys, "argv", [str(script)]):
             with self.assertRaises(SystemExit) as exc:
-                runpy.run_path(str(repo_root / "ci/invariants/check_invariants.py"), run_name="__main__")
+                runpy.run_path(str(script), run_name="__main__")
         expected = 0 if git_commit_exists("HEAD", repo_root) else 1
         self.assertEqual(exc.exception.code, expected)
 
@@ -310,6 +621,13 @@ class TestInvariantBase(unittest.TestCase):
         with self.assertRaises(NotImplementedError):
             InvariantChecker(Path(".")).check()
 
+    def test_result_compares_as_string(self):
+        check = InvariantCheck("DUMMY", InvariantResult.FAIL, "fail")
+        self.assertEqual(check.result, "FAIL")
+        self.assertEqual(json.dumps(check.to_dict()["result"]), '"FAIL"')
+        with self.assertRaises(AttributeError):
+            check.extra = True
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -8,6 +8,7 @@ import tempfile
 import unittest
 from contextlib import redirect_stderr, redirect_stdout
 from pathlib import Path
+from unittest import mock
 
 from evoalign import cli
 from evoalign.provenance import sha256_data_file, sha256_file
@@ -170,6 +171,25 @@ class TestCli(unittest.TestCase):
         self.assertFalse(passed)
         self.assertTrue(results)
 
+    def test_run_evidence_chain_shares_caches(self):
+        invariants_root = Path(__file__).resolve().parents[1] / "ci" / "invariants"
+        _, result_type = cli.load_invariant_classes(invariants_root)
+        seen = []
+
+        class Recorder:
+            def __init__(self, repo_root, hash_cache, artifacts):
+                seen.append((hash_cache, artifacts))
+
+            def check(self):
+                return mock.Mock(result=result_type.PASS)
+
+        with mock.patch.object(cli, "load_invariant_classes", return_value=([Recorder, Recorder], result_type)):
+            _, passed = cli.run_evidence_chain(self.test_dir, invariants_root=invariants_root)
+        self.assertTrue(passed)
+        (first_hashes, first_artifacts), (second_hashes, second_artifacts) = seen
+        self.assertIs(first_hashes, second_hashes)
+        self.assertIs(first_artifacts, second_artifacts)
+
     def test_verify_chain_failure(self):
         repo_root = self.test_dir
         fit_path = repo_root / "control_plane/governor/risk_fits/fit.json"
@@ -3,10 +3,14 @@ import hashlib
 import json
 import shutil
 import tempfile
+import threading
 import unittest
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from unittest import mock
 
+import yaml
+
 from evoalign import provenance
 
 
@@ -21,6 +25,11 @@ class TestProvenance(unittest.TestCase):
         payload = {"b": 1, "a": 2}
         self.assertEqual(provenance.canonical_bytes(payload), b"{\"a\":2,\"b\":1}")
 
+    def test_canonical_bytes_matches_json_dumps(self):
+        payload = {"z": [1.5, None, True], "a": {"caf\u00e9": "\u2713", "n": -3}}
+        expected = json.dumps(payload, sort_keys=True, separators=(",", ":"), ensure_ascii=True)
+        self.assertEqual(provenance.canonical_bytes(payload), expected.encode("utf-8"))
+
     def test_canonical_bytes_invalid(self):
         with self.assertRaises(ValueError):
             provenance.canonical_bytes({"bad": {1, 2}})
@@ -48,12 +57,143 @@ class TestProvenance(unittest.TestCase):
         self.assertEqual(provenance.sha256_data_file(json_path), expected_hash)
         self.assertEqual(provenance.sha256_data_file(yaml_path), expected_hash)
 
+    def test_sha256_file_large_payload(self):
+        payload = bytes(range(256)) * 4096
+        data_path = self.test_dir / "blob.bin"
+        data_path.write_bytes(payload)
+        expected = hashlib.sha256(payload).hexdigest()
+        self.assertEqual(provenance.sha256_file(data_path), f"sha256:{expected}")
+
     def test_load_data_file_invalid_suffix(self):
         bad_path = self.test_dir / "data.txt"
         bad_path.write_text("data")
         with self.assertRaises(ValueError):
             provenance.load_data_file(bad_path)
 
+    def test_hash_cache_memoizes_until_file_changes(self):
+        data_path = self.test_dir / "data.json"
+        data_path.write_text(json.dumps({"a": 1}))
+        cache = provenance.HashCache()
+
+        with mock.patch.object(provenance, "sha256_data_file", wraps=provenance.sha256_data_file) as wrapped:
+            first = cache.sha256_data_file(data_path)
+            self.assertEqual(cache.sha256_data_file(data_path), first)
+            self.assertEqual(wrapped.call_count, 1)
+
+            data_path.write_text(json.dumps({"a": 12}))
+            self.assertEqual(cache.sha256_data_file(data_path), provenance.sha256_canonical({"a": 12}))
+            self.assertEqual(wrapped.call_count, 2)
+
+    def test_optional_module(self):
+        self.assertIs(provenance._optional_module("json"), json)
+        self.assertIsNone(provenance._optional_module("evoalign_missing_module"))
+
+    def test_json_loads_prefers_fast_parser(self):
+        class DecodeError(ValueError):
+            pass
+
+        fast = mock.Mock(JSONDecodeError=DecodeError)
+        fast.loads.return_value = {"fast": True}
+        with mock.patch.object(provenance, "_ORJSON", fast):
+            self.assertEqual(provenance.json_loads(b'{"a": 1}'), {"fast": True})
+            fast.loads.side_effect = DecodeError("NaN")
+            self.assertIsInstance(provenance.json_loads(b'{"a": NaN}')["a"], float)
+        with mock.patch.object(provenance, "_ORJSON", None):
+            self.assertEqual(provenance.json_loads(b'{"a": 1}'), {"a": 1})
+
+    def test_yaml_loads_keeps_yaml_semantics_for_json_documents(self):
+        self.assertEqual(provenance.yaml_loads(b'{"a": 1e5, "b": 1.0e5}'), {"a": "1e5", "b": "1.0e5"})
+        self.assertEqual(provenance.yaml_loads(b'{"a": NaN}'), {"a": "NaN"})
+        self.assertEqual(provenance.yaml_loads(b'{"a": "x\xc2\x85y"}'), {"a": "x y"})
+
+        for document in (b'{"a": "\\ud83d\\ude00"}', b'{"a": "\x7f"}', b'{"a"\n: 1}'):
+            with self.subTest(document=document):
+                with self.assertRaises(yaml.YAMLError):
+                    provenance.yaml_loads(document)
+
+    def test_hash_cache_persists_across_runs(self):
+        data_path = self.test_dir / "data.json"
+        data_path.write_text(json.dumps({"a": 1}))
+        cache_path = self.test_dir / "digests.json"
+
+        first = provenance.HashCache(cache_path)
+        digest = first.sha256_data_file(data_path)
+        first.save()
+        saved = cache_path.read_text()
+        first.save()
+        self.assertEqual(cache_path.read_text(), saved)
+
+        second = provenance.HashCache(cache_path)
+        with mock.patch.object(provenance, "sha256_data_file") as wrapped:
+            self.assertEqual(second.sha256_data_file(data_path), digest)
+            wrapped.assert_not_called()
+
+        provenance.HashCache().save()
+
+    def test_hash_cache_keys_on_sha256_of_file_bytes(self):
+        data_path = self.test_dir / "data.json"
+        data_path.write_text(json.dumps({"a": 1}))
+        cache_path = self.test_dir / "digests.json"
+        legacy_key = hashlib.sha1(b"blob %d\0" % data_path.stat().st_size + data_path.read_bytes()).hexdigest()
+        cache_path.write_text(json.dumps({f"{legacy_key}.json": "sha256:forged"}))
+
+        cache = provenance.HashCache(cache_path)
+        self.assertEqual(cache.sha256_data_file(data_path), provenance.sha256_data_file(data_path))
+        cache.save()
+        self.assertEqual(
+            json.loads(cache_path.read_text()),
+            {f"{provenance.sha256_file(data_path)}.json": provenance.sha256_data_file(data_path)},
+        )
+
+    def test_hash_cache_sha256_parsed_shares_digests(self):
+        data_path = self.test_dir / "data.json"
+        data_path.write_text(json.dumps({"a": 1}))
+        cache_path = self.test_dir / "digests.json"
+
+        first = provenance.HashCache(cache_path)
+        digest = first.sha256_parsed(data_path, {"a": 1})
+        self.assertEqual(digest, provenance.sha256_data_file(data_path))
+        first.save()
+
+        second = provenance.HashCache(cache_path)
+        with mock.patch.object(provenance, "sha256_canonical") as canonical:
+            self.assertEqual(second.sha256_parsed(data_path, {"a": 1}), digest)
+            self.assertEqual(second.sha256_data_file(data_path), digest)
+            canonical.assert_not_called()
+
+    def test_hash_cache_concurrent_fills(self):
+        paths = []
+        for index in range(20):
+            paths.append(self.test_dir / f"data_{index}.json")
+            paths[-1].write_text(json.dumps({"index": index}))
+        cache_path = self.test_dir / "digests.json"
+        cache = provenance.HashCache(cache_path)
+        both_missed = threading.Barrier(2)
+        compute = provenance.sha256_data_file
+
+        def slow_compute(path):
+            if path == paths[0]:
+                both_missed.wait(timeout=5)
+            return compute(path)
+
+        with mock.patch.object(provenance, "sha256_data_file", side_effect=slow_compute) as computed:
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                digests = list(executor.map(cache.sha256_data_file, [paths[0], *paths]))
+        # The only race is two threads computing the same (equal) digest.
+        self.assertEqual(computed.call_count, len(paths) + 1)
+        self.assertEqual(digests, [compute(paths[0]), *map(compute, paths)])
+        cache.save()
+        self.assertEqual(len(json.loads(cache_path.read_text())), len(paths))
+
+    def test_hash_cache_ignores_unreadable_cache_file(self):
+        data_path = self.test_dir / "data.json"
+        data_path.write_text(json.dumps({"a": 1}))
+        for contents in ("{not-json", "[]"):
+            cache_path = self.test_dir / "digests.json"
+            cache_path.write_text(contents)
+            cache = provenance.HashCache(cache_path)
+            self.assertEqual(cache.sha256_data_file(data_path), provenance.sha256_canonical({"a": 1}))
+
     def test_normalize_and_verify(self):
         self.assertEqual(provenance.normalize_hash("sha256:abc"), "abc")
         self.assertEqual(provenance.normalize_hash(""), "")
@@ -75,6 +215,25 @@ class TestProvenance(unittest.TestCase):
 
         self.assertFalse(provenance.git_commit_exists(None, self.test_dir))
 
+    def test_existing_git_commits(self):
+        with mock.patch("subprocess.run") as mocked:
+            mocked.return_value.returncode = 0
+            mocked.return_value.stdout = "abc123 commit 210\nbad missing\n"
+            found = provenance.existing_git_commits(["HEAD", "bad", None, "", "a\nb", "HEAD"], self.test_dir)
+            self.assertEqual(found, {"HEAD"})
+            self.assertEqual(mocked.call_count, 1)
+            self.assertEqual(mocked.call_args.kwargs["input"], "HEAD\nbad\n")
+
+            mocked.return_value.returncode = 128
+            self.assertEqual(provenance.existing_git_commits(["HEAD"], self.test_dir), set())
+
+        with mock.patch("subprocess.run", side_effect=OSError):
+            self.assertEqual(provenance.existing_git_commits(["HEAD"], self.test_dir), set())
+
+        with mock.patch("subprocess.run") as mocked:
+            self.assertEqual(provenance.existing_git_commits([None, ""]), set())
+            mocked.assert_not_called()
+
 
 if __name__ == "__main__":
     unittest.main()